@@ -1,39 +1,74 @@
-from fastapi import FastAPI, UploadFile, File, Form, BackgroundTasks, Header, HTTPException, Request
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, UploadFile, File, Form, Header, HTTPException, Request
+from fastapi.responses import FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from core.converter import SaaSConverter
+from core.ai_providers import NOTE_SECTIONS
 from core.security import key_manager
+from core.storage import LocalStorage, create_storage
+from core.janitor import TempJanitor
+from core.checkpoint import JobBusyError, scoped_job_id
+from core.batch import BatchConverter, extract_pdfs_from_zip, unique_output_names, write_batch_zip
 import os
+import io
+import base64
+import shutil
 import uuid
+import zipfile
+import threading
 from pathlib import Path
 from typing import Optional, List, Dict
 from dotenv import load_dotenv
-import firebase_admin
-from firebase_admin import credentials, auth, firestore
 from pydantic import BaseModel
 
 # Load .env file
 load_dotenv()
 
-# Initialize Firebase Admin
-cred_path = os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH")
+# Firebase Admin is initialized lazily (and warmed up in the background on
+# startup) so that importing the app stays cheap on Cloud Run cold starts.
+_firebase_lock = threading.Lock()
+_db = None
 
-if cred_path and os.path.exists(cred_path):
-    cred = credentials.Certificate(cred_path)
-    try:
-        firebase_admin.get_app()
-    except ValueError:
-        firebase_admin.initialize_app(cred)
-else:
-    try:
-        firebase_admin.get_app()
-    except ValueError:
-        firebase_admin.initialize_app()
+def get_db():
+    """Initialize the Firebase Admin app once and return the Firestore client."""
+    global _db
+    if _db is not None:
+        return _db
+    with _firebase_lock:
+        if _db is not None:
+            return _db
 
-db = firestore.client()
+        import firebase_admin
+        from firebase_admin import credentials, firestore
+
+        cred_path = os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH")
+
+        if cred_path and os.path.exists(cred_path):
+            cred = credentials.Certificate(cred_path)
+            try:
+                firebase_admin.get_app()
+            except ValueError:
+                firebase_admin.initialize_app(cred)
+        else:
+            try:
+                firebase_admin.get_app()
+            except ValueError:
+                firebase_admin.initialize_app()
+
+        _db = firestore.client()
+        return _db
 
 app = FastAPI(title="NotePPT API")
 
+@app.on_event("startup")
+def warm_up_firebase():
+    def _warm_up():
+        try:
+            get_db()
+        except Exception as e:
+            print(f"Firebase warm-up failed: {e}")
+    threading.Thread(target=_warm_up, daemon=True).start()
+
 class UserKeys(BaseModel):
     provider: str
     api_key: str
@@ -51,7 +86,85 @@ app.add_middleware(
 import tempfile
 
 # Use /tmp for Cloud Run (Read-only filesystem elsewhere)
-TEMP_DIR = Path(tempfile.gettempdir())
+TEMP_DIR = Path(tempfile.gettempdir()) / "noteppt"
+# Uploads and per-request scratch files
+WORK_DIR = TEMP_DIR / "work"
+WORK_DIR.mkdir(parents=True, exist_ok=True)
+
+PPTX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+ZIP_MEDIA_TYPE = "application/zip"
+# Media types for stored outputs, by key suffix
+DOWNLOAD_MEDIA_TYPES = {".pptx": PPTX_MEDIA_TYPE, ".zip": ZIP_MEDIA_TYPE}
+DOWNLOAD_URL_TTL = int(os.getenv("DOWNLOAD_URL_TTL", "3600"))
+# Public origin of this API (e.g. https://api.example.com) used for local
+# download URLs; falls back to the request's base URL
+PUBLIC_BASE_URL = os.getenv("PUBLIC_BASE_URL")
+
+# Preview limits; thumbnails are meant to be small
+PREVIEW_MIN_DPI = 18
+PREVIEW_MAX_DPI = 96
+PREVIEW_MAX_COLUMNS = 12
+
+# Batch conversion limits; LLM concurrency is shared by every slide in a batch
+BATCH_MAX_FILES = int(os.getenv("BATCH_MAX_FILES", "50"))
+BATCH_RENDER_WORKERS = int(os.getenv("BATCH_RENDER_WORKERS", "2"))
+BATCH_LLM_CONCURRENCY = int(os.getenv("BATCH_LLM_CONCURRENCY", "8"))
+# Documents whose rendered pages may sit in memory at once
+BATCH_DOCUMENTS_IN_FLIGHT = int(os.getenv("BATCH_DOCUMENTS_IN_FLIGHT", "4"))
+
+# Per-slide job checkpoints are opt-in: always on when CHECKPOINT_DIR is set
+# (point it at a persistent volume to survive instance restarts), otherwise
+# only for requests that send a job_id. The fallback lives outside TEMP_DIR so
+# the temp size budget never evicts a running job's slides.
+CHECKPOINT_DIR = Path(os.getenv("CHECKPOINT_DIR")) if os.getenv("CHECKPOINT_DIR") else None
+JOB_CHECKPOINT_DIR = CHECKPOINT_DIR or Path(tempfile.gettempdir()) / "noteppt-checkpoints"
+CHECKPOINT_TTL = float(os.getenv("CHECKPOINT_TTL_SECONDS", str(24 * 3600)))
+
+# Local outputs default to a subdirectory of TEMP_DIR so the janitor covers them
+OUTPUT_DIR = Path(os.getenv("STORAGE_DIR") or TEMP_DIR / "outputs")
+storage = None
+
+def get_storage():
+    global storage
+    if storage is None:
+        if os.getenv("STORAGE_BACKEND", "local").lower() == "gcs":
+            get_db()  # firebase_admin must be initialized for the bucket client
+        base_url = f"{PUBLIC_BASE_URL.rstrip('/')}/download" if PUBLIC_BASE_URL else "/download"
+        storage = create_storage(root=OUTPUT_DIR, base_url=base_url)
+    return storage
+
+def absolute_url(request: Request, url: str) -> str:
+    """Make a root-relative URL absolute so a frontend on another origin can use it."""
+    if url.startswith("/"):
+        return str(request.base_url).rstrip("/") + url
+    return url
+
+# Each directory gets its own budget. Files held by running jobs are never
+# swept, and outputs are not trimmed for size before their URLs expire.
+TEMP_MAX_AGE = float(os.getenv("TEMP_MAX_AGE_SECONDS", "3600"))
+janitor = TempJanitor()
+janitor.add_directory(
+    WORK_DIR,
+    TEMP_MAX_AGE,
+    max_bytes=int(os.getenv("TEMP_MAX_BYTES", str(512 * 1024 * 1024)))
+)
+janitor.add_directory(
+    OUTPUT_DIR,
+    max(TEMP_MAX_AGE, DOWNLOAD_URL_TTL),
+    max_bytes=int(os.getenv("OUTPUT_MAX_BYTES", str(512 * 1024 * 1024))),
+    keep_younger_than=DOWNLOAD_URL_TTL
+)
+# Abandoned checkpoints expire as a whole, aged by their newest slide, so a
+# job that is still writing slides is never collected
+janitor.add_directory(JOB_CHECKPOINT_DIR, CHECKPOINT_TTL, per_subdirectory=True)
+
+@app.on_event("startup")
+def start_janitor():
+    janitor.start(interval=float(os.getenv("JANITOR_INTERVAL_SECONDS", "300")))
+
+@app.on_event("shutdown")
+def stop_janitor():
+    janitor.stop()
 
 @app.get("/")
 def read_root():
@@ -61,6 +174,8 @@ async def verify_token(authorization: Optional[str] = Header(None)):
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Missing or invalid token")
     token = authorization.split("Bearer ")[1]
+    get_db()
+    from firebase_admin import auth
     try:
         decoded_token = auth.verify_id_token(token)
         return decoded_token["uid"]
@@ -73,7 +188,7 @@ async def save_keys(keys: UserKeys, uid: str = Header(...)):
     # For now, we take uid from header or token
     encrypted_key = key_manager.encrypt_key(keys.api_key)
     
-    user_ref = db.collection("users").document(uid)
+    user_ref = get_db().collection("users").document(uid)
     user_ref.set({
         "keys": {
             keys.provider: encrypted_key
@@ -84,7 +199,7 @@ async def save_keys(keys: UserKeys, uid: str = Header(...)):
 
 @app.get("/get-keys")
 async def get_keys(uid: str = Header(...)):
-    user_ref = db.collection("users").document(uid).get()
+    user_ref = get_db().collection("users").document(uid).get()
     if user_ref.exists:
         data = user_ref.to_dict()
         encrypted_keys = data.get("keys", {})
@@ -93,6 +208,7 @@ async def get_keys(uid: str = Header(...)):
     return {}
 
 def cleanup_files(paths: List[Path]):
+    janitor.release(*paths)
     for path in paths:
         try:
             if path.exists():
@@ -100,34 +216,13 @@ def cleanup_files(paths: List[Path]):
         except Exception as e:
             print(f"Error cleaning up {path}: {e}")
 
-@app.post("/convert")
-async def start_conversion(
-    request: Request,
-    background_tasks: BackgroundTasks,
-    pdf_file: UploadFile = File(...),
-    provider: str = Form("gemini"),
-    api_key: Optional[str] = Form(None),
-    model: Optional[str] = Form(None),
-    context_text: Optional[str] = Form(None),
-    dpi: int = Form(144),
-    remove_watermark: bool = Form(True),
-    generate_notes: bool = Form(True),
-    uid: Optional[str] = Header(None)
-):
-    job_id = str(uuid.uuid4())
-    pdf_path = TEMP_DIR / f"{job_id}.pdf"
-    pptx_path = TEMP_DIR / f"{job_id}.pptx"
-    
-    # Save uploaded PDF
-    with open(pdf_path, "wb") as buffer:
-        buffer.write(await pdf_file.read())
-        
+def resolve_api_key(provider: str, api_key: Optional[str], uid: Optional[str]) -> Optional[str]:
     # API Key retrieval logic (Priority: Request -> Firestore -> Env)
     effective_api_key = api_key
     
     if not effective_api_key and uid:
         try:
-            user_ref = db.collection("users").document(uid).get()
+            user_ref = get_db().collection("users").document(uid).get()
             if user_ref.exists:
                 data = user_ref.to_dict()
                 encrypted_keys = data.get("keys", {})
@@ -147,9 +242,55 @@ async def start_conversion(
         elif provider == 'grok':
             effective_api_key = os.getenv("XAI_API_KEY")
 
+    return effective_api_key
+
+@app.post("/convert")
+async def start_conversion(
+    request: Request,
+    pdf_file: UploadFile = File(...),
+    provider: str = Form("gemini"),
+    api_key: Optional[str] = Form(None),
+    model: Optional[str] = Form(None),
+    context_text: Optional[str] = Form(None),
+    dpi: int = Form(144),
+    auto_dpi: bool = Form(False),
+    min_dpi: int = Form(72),
+    remove_watermark: bool = Form(True),
+    generate_notes: bool = Form(True),
+    pages: Optional[str] = Form(None),
+    delivery: str = Form("file"),
+    job_id: Optional[str] = Form(None),
+    notes_max_chars: Optional[int] = Form(None),
+    notes_stop_on_sections: bool = Form(False),
+    notes_input: str = Form("image"),
+    uid: Optional[str] = Header(None)
+):
+    if delivery not in ("file", "url"):
+        raise HTTPException(status_code=400, detail=f"Unsupported delivery mode: {delivery}")
+
+    # A client-supplied job_id enables checkpointing and names the checkpoint
+    # to resume, scoped to the caller so users never share one; with
+    # CHECKPOINT_DIR set and no job_id, the checkpoint is keyed by the input
+    # hash, so identical retries also resume.
+    checkpoint_id = None
+    if job_id:
+        try:
+            checkpoint_id = scoped_job_id(job_id, uid)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    job_id = str(uuid.uuid4())
+    pdf_path = WORK_DIR / f"{job_id}.pdf"
+    janitor.acquire(pdf_path)
+    
+    # Save uploaded PDF
+    with open(pdf_path, "wb") as buffer:
+        buffer.write(await pdf_file.read())
+        
+    effective_api_key = resolve_api_key(provider, api_key, uid)
+
     if not effective_api_key:
         # Cleanup
-        if pdf_path.exists(): os.remove(pdf_path)
+        cleanup_files([pdf_path])
         raise HTTPException(status_code=400, detail=f"{provider} API Key is required.")
 
     # Convert
@@ -163,35 +304,254 @@ async def start_conversion(
             api_key=effective_api_key,
             model=effective_model,
             dpi=dpi,
-            remove_watermark=remove_watermark
+            remove_watermark=remove_watermark,
+            auto_dpi=auto_dpi,
+            min_dpi=min_dpi,
+            checkpoint_dir=JOB_CHECKPOINT_DIR if (CHECKPOINT_DIR or checkpoint_id) else None,
+            notes_max_chars=notes_max_chars,
+            notes_stop_sections=NOTE_SECTIONS if notes_stop_on_sections else None,
+            notes_input=notes_input
         )
         
+        # Build the PPTX in memory; it never lands in TEMP_DIR
+        pptx_buffer = io.BytesIO()
         converter.convert(
             pdf_path, 
-            pptx_path, 
+            pptx_buffer, 
             generate_notes=generate_notes, 
-            context=context_text
+            context=context_text,
+            pages=pages,
+            job_id=checkpoint_id
         )
         
-        if not pptx_path.exists():
+        if pptx_buffer.tell() == 0:
             raise Exception("Conversion failed to create output file")
-            
-        # Schedule cleanup - Temporarily disabled to debug streaming issues
-        # background_tasks.add_task(cleanup_files, [pdf_path, pptx_path])
+        pptx_buffer.seek(0)
+
+        if delivery == "url":
+            key = f"{job_id}.pptx"
+            get_storage().upload(pptx_buffer, key, content_type=PPTX_MEDIA_TYPE)
+            return {
+                "job_id": job_id,
+                "download_url": absolute_url(request, get_storage().get_download_url(key, DOWNLOAD_URL_TTL)),
+                "expires_in": DOWNLOAD_URL_TTL
+            }
         
         headers = {
             "Access-Control-Allow-Origin": "*",
-            "Access-Control-Expose-Headers": "Content-Disposition"
+            "Access-Control-Expose-Headers": "Content-Disposition",
+            "Content-Disposition": f'attachment; filename="converted_{job_id[:8]}.pptx"'
         }
         
-        return FileResponse(
-            pptx_path,
-            media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            filename=f"converted_{job_id[:8]}.pptx",
+        return Response(
+            content=pptx_buffer.getvalue(),
+            media_type=PPTX_MEDIA_TYPE,
             headers=headers
         )
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except JobBusyError:
+        raise HTTPException(status_code=409, detail="This job is already being converted; retry when it finishes.")
     except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
         cleanup_files([pdf_path])
-        if pptx_path.exists(): cleanup_files([pptx_path])
+
+@app.get("/download/{key:path}")
+async def download(key: str, expires: int, sig: str):
+    """Serve a locally stored output through a signed, expiring URL."""
+    backend = get_storage()
+    if not isinstance(backend, LocalStorage):
+        raise HTTPException(status_code=404, detail="Not found")
+    try:
+        path = backend.path_for(key)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="Not found")
+    if not backend.verify(key, expires, sig) or not path.exists():
+        raise HTTPException(status_code=403, detail="Download link is invalid or expired")
+    media_type = DOWNLOAD_MEDIA_TYPES.get(path.suffix.lower(), "application/octet-stream")
+    return FileResponse(path, media_type=media_type, filename=path.name)
+
+@app.post("/convert-batch")
+async def start_batch_conversion(
+    request: Request,
+    files: List[UploadFile] = File(...),
+    provider: str = Form("gemini"),
+    api_key: Optional[str] = Form(None),
+    model: Optional[str] = Form(None),
+    context_text: Optional[str] = Form(None),
+    dpi: int = Form(144),
+    auto_dpi: bool = Form(False),
+    min_dpi: int = Form(72),
+    remove_watermark: bool = Form(True),
+    generate_notes: bool = Form(True),
+    pages: Optional[str] = Form(None),
+    delivery: str = Form("file"),
+    notes_max_chars: Optional[int] = Form(None),
+    notes_stop_on_sections: bool = Form(False),
+    notes_input: str = Form("image"),
+    uid: Optional[str] = Header(None)
+):
+    """
+    Convert many PDFs (or zips of PDFs) in one request. Returns a zip of PPTX
+    files plus status.json with per-file status.
+    """
+    if delivery not in ("file", "url"):
+        raise HTTPException(status_code=400, detail=f"Unsupported delivery mode: {delivery}")
+
+    batch_id = str(uuid.uuid4())
+    batch_dir = WORK_DIR / f"batch_{batch_id}"
+    janitor.acquire(batch_dir)
+    batch_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        # Save uploads, expanding zip archives into their PDFs
+        inputs = []
+        for n, upload in enumerate(files):
+            upload_name = Path(upload.filename or f"document_{n}.pdf").name
+            upload_path = batch_dir / f"upload_{n:04d}"
+            with open(upload_path, "wb") as buffer:
+                buffer.write(await upload.read())
+
+            if upload_name.lower().endswith(".zip"):
+                members = await run_in_threadpool(
+                    extract_pdfs_from_zip, upload_path, batch_dir / f"zip_{n:04d}", max_files=BATCH_MAX_FILES
+                )
+                inputs.extend((f"{upload_name}/{member}", path) for member, path in members)
+            else:
+                inputs.append((upload_name, upload_path))
+
+        if not inputs:
+            raise HTTPException(status_code=400, detail="No PDF files found in request.")
+        if len(inputs) > BATCH_MAX_FILES:
+            raise HTTPException(status_code=400, detail=f"Too many files (max {BATCH_MAX_FILES}).")
+
+        effective_api_key = await run_in_threadpool(resolve_api_key, provider, api_key, uid)
+        if not effective_api_key:
+            raise HTTPException(status_code=400, detail=f"{provider} API Key is required.")
+
+        effective_model = model
+        if provider == 'gemini' and not effective_model:
+            effective_model = 'gemini-2.0-flash'
+
+        converter = SaaSConverter(
+            provider=provider,
+            api_key=effective_api_key,
+            model=effective_model,
+            dpi=dpi,
+            remove_watermark=remove_watermark,
+            auto_dpi=auto_dpi,
+            min_dpi=min_dpi,
+            notes_max_chars=notes_max_chars,
+            notes_stop_sections=NOTE_SECTIONS if notes_stop_on_sections else None,
+            notes_input=notes_input
+        )
+        batch = BatchConverter(
+            converter,
+            render_workers=BATCH_RENDER_WORKERS,
+            llm_concurrency=BATCH_LLM_CONCURRENCY,
+            max_documents_in_flight=BATCH_DOCUMENTS_IN_FLIGHT
+        )
+
+        output_names = unique_output_names([name for name, _ in inputs])
+        zip_buffer = io.BytesIO()
+
+        def run_batch():
+            results = batch.convert_many(
+                [(output_name, path) for output_name, (_, path) in zip(output_names, inputs)],
+                generate_notes=generate_notes,
+                context=context_text,
+                pages=pages,
+                sources=[name for name, _ in inputs]
+            )
+            write_batch_zip(results, zip_buffer)
+            zip_buffer.seek(0)
+            return results
+
+        # Rendering and notes block for the whole batch; keep the event loop free
+        results = await run_in_threadpool(run_batch)
+
+        if delivery == "url":
+            key = f"{batch_id}.zip"
+            await run_in_threadpool(get_storage().upload, zip_buffer, key, content_type=ZIP_MEDIA_TYPE)
+            return {
+                "job_id": batch_id,
+                "download_url": absolute_url(request, get_storage().get_download_url(key, DOWNLOAD_URL_TTL)),
+                "expires_in": DOWNLOAD_URL_TTL,
+                "files": [result.to_dict() for result in results]
+            }
+
+        headers = {
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Expose-Headers": "Content-Disposition",
+            "Content-Disposition": f'attachment; filename="converted_{batch_id[:8]}.zip"'
+        }
+        return Response(content=zip_buffer.getvalue(), media_type=ZIP_MEDIA_TYPE, headers=headers)
+
+    except HTTPException:
+        raise
+    except (ValueError, zipfile.BadZipFile) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        await run_in_threadpool(shutil.rmtree, batch_dir, ignore_errors=True)
+        janitor.release(batch_dir)
+
+@app.post("/preview")
+async def preview(
+    pdf_file: UploadFile = File(...),
+    pages: Optional[str] = Form(None),
+    dpi: int = Form(36),
+    columns: int = Form(4),
+    mode: str = Form("sheet"),
+    remove_watermark: bool = Form(True)
+):
+    """
+    Fast low-DPI preview. `mode="sheet"` returns a single PNG contact sheet;
+    `mode="thumbnails"` returns a JSON list of base64 PNG data URLs.
+    """
+    if mode not in ("sheet", "thumbnails"):
+        raise HTTPException(status_code=400, detail=f"Unsupported preview mode: {mode}")
+    if not PREVIEW_MIN_DPI <= dpi <= PREVIEW_MAX_DPI:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Preview dpi must be between {PREVIEW_MIN_DPI} and {PREVIEW_MAX_DPI}."
+        )
+    if not 1 <= columns <= PREVIEW_MAX_COLUMNS:
+        raise HTTPException(status_code=400, detail=f"columns must be between 1 and {PREVIEW_MAX_COLUMNS}.")
+
+    job_id = str(uuid.uuid4())
+    pdf_path = WORK_DIR / f"{job_id}_preview.pdf"
+    janitor.acquire(pdf_path)
+
+    with open(pdf_path, "wb") as buffer:
+        buffer.write(await pdf_file.read())
+
+    def build_preview():
+        converter = SaaSConverter(dpi=dpi, remove_watermark=remove_watermark)
+        thumbnails = converter.render_preview(pdf_path, pages=pages, dpi=dpi)
+
+        if mode == "sheet":
+            sheet = converter.create_contact_sheet(thumbnails, columns=columns)
+            with io.BytesIO() as buffer:
+                sheet.save(buffer, format="PNG")
+                return Response(content=buffer.getvalue(), media_type="image/png")
+
+        encoded = []
+        for img in thumbnails:
+            with io.BytesIO() as buffer:
+                img.save(buffer, format="PNG")
+                encoded.append("data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("utf-8"))
+        return {"pages": len(encoded), "thumbnails": encoded}
+
+    try:
+        # Rendering a large deck takes seconds; keep the event loop free
+        return await run_in_threadpool(build_preview)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        cleanup_files([pdf_path])
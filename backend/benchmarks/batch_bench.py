@@ -0,0 +1,66 @@
+"""
+Batch vs independent conversion benchmark
+
+Converts N copies of a PDF with the fake provider, first one document at a
+time (like N separate /convert requests) and then through BatchConverter's
+shared render pool and global LLM concurrency budget.
+
+Usage (from backend/):
+    python benchmarks/batch_bench.py path/to/deck.pdf [--docs 4] [--latency 0.3]
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.ai_providers.fake import FakeProvider
+from core.batch import BatchConverter
+from core.converter import SaaSConverter
+
+
+def make_converter(latency: float) -> SaaSConverter:
+    converter = SaaSConverter()
+    converter.ai_provider = FakeProvider(latency=latency)
+    return converter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("pdf")
+    parser.add_argument("--docs", type=int, default=4)
+    parser.add_argument("--pages", default=None, help="page range per document, e.g. 1-5")
+    parser.add_argument("--latency", type=float, default=0.3, help="simulated seconds per notes call")
+    parser.add_argument("--render-workers", type=int, default=2)
+    parser.add_argument("--llm-concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    documents = [(f"doc_{n}.pptx", args.pdf) for n in range(args.docs)]
+
+    converter = make_converter(args.latency)
+    start = time.perf_counter()
+    for _, path in documents:
+        with io.BytesIO() as buffer:
+            converter.convert(path, buffer, pages=args.pages)
+    serial_s = time.perf_counter() - start
+
+    batch = BatchConverter(
+        make_converter(args.latency),
+        render_workers=args.render_workers,
+        llm_concurrency=args.llm_concurrency
+    )
+    start = time.perf_counter()
+    results = batch.convert_many(documents, pages=args.pages)
+    batch_s = time.perf_counter() - start
+
+    slides = sum(result.slides for result in results)
+    print(f"documents {args.docs}, slides {slides}, notes latency {args.latency}s")
+    print(f"independent {serial_s:8.2f} s   {slides / serial_s:6.1f} slides/s")
+    print(f"batch       {batch_s:8.2f} s   {slides / batch_s:6.1f} slides/s   ({serial_s / batch_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Fixed vs adaptive DPI render benchmark
+
+Renders the same PDF with a fixed DPI and with auto_dpi, reporting render
+time, total PNG bytes and the DPI chosen per page.
+
+Usage (from backend/):
+    python benchmarks/dpi_bench.py path/to/deck.pdf [--dpi 144]
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fitz  # PyMuPDF
+
+from core.converter import SaaSConverter
+
+
+def run(converter: SaaSConverter, pdf_path: str):
+    start = time.perf_counter()
+    images = converter.convert_pdf_to_images(pdf_path)
+    render_s = time.perf_counter() - start
+
+    total_bytes = 0
+    for img in images:
+        with io.BytesIO() as buffer:
+            img.save(buffer, format="PNG")
+            total_bytes += buffer.tell()
+    return render_s, total_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("pdf")
+    parser.add_argument("--dpi", type=int, default=144)
+    parser.add_argument("--min-dpi", type=int, default=72)
+    args = parser.parse_args()
+
+    fixed = SaaSConverter(dpi=args.dpi)
+    adaptive = SaaSConverter(dpi=args.dpi, auto_dpi=True, min_dpi=args.min_dpi)
+
+    with fitz.open(args.pdf) as doc:
+        chosen = [adaptive.select_dpi(page) for page in doc]
+    print(f"auto DPI per page: {chosen}")
+
+    for name, converter in (("fixed", fixed), ("auto", adaptive)):
+        render_s, total_bytes = run(converter, args.pdf)
+        print(f"{name:<6} render {render_s * 1000:8.1f} ms   png {total_bytes / 1024:10.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Notes input mode benchmark
+
+Generates notes for the same PDF in each notes input mode (image, hybrid,
+text) with the fake provider, reporting wall time and estimated input
+tokens. Latency is modelled as a fixed per-call cost plus a per-input-token
+cost, so smaller payloads finish sooner.
+
+Usage (from backend/):
+    python benchmarks/notes_input_bench.py path/to/deck.pdf [--pages 1-10]
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.ai_providers.fake import FakeProvider
+from core.converter import SaaSConverter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("pdf")
+    parser.add_argument("--pages", default=None)
+    parser.add_argument("--dpi", type=int, default=144)
+    parser.add_argument("--latency", type=float, default=0.05, help="fixed seconds per call")
+    parser.add_argument("--token-latency", type=float, default=0.0001, help="seconds per input token")
+    args = parser.parse_args()
+
+    print(f"{'mode':<8} {'time':>9} {'calls':>6} {'input tokens':>13} {'tokens/slide':>13}")
+    for mode in SaaSConverter.NOTES_INPUT_MODES:
+        converter = SaaSConverter(dpi=args.dpi, notes_input=mode)
+        provider = FakeProvider(latency=args.latency, input_token_latency=args.token_latency)
+        converter.ai_provider = provider
+
+        start = time.perf_counter()
+        with io.BytesIO() as buffer:
+            converter.convert(args.pdf, buffer, pages=args.pages)
+        elapsed = time.perf_counter() - start
+
+        per_slide = provider.input_tokens / max(1, provider.calls)
+        print(f"{mode:<8} {elapsed:8.2f}s {provider.calls:6d} {provider.input_tokens:13d} {per_slide:13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Cold-start import time benchmark
+
+Runs each import scenario in a fresh interpreter and reports the median
+wall time. "eager" reproduces the old startup path (every provider SDK and
+Firebase Admin imported up front); "lazy" is the current import path.
+
+Usage (from backend/):
+    python benchmarks/startup_bench.py [--runs 5]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    "eager (before)": (
+        "import core.ai_providers.gemini, core.ai_providers.openai, "
+        "core.ai_providers.anthropic, core.ai_providers.grok\n"
+        "try:\n"
+        "    import firebase_admin, firebase_admin.firestore, firebase_admin.auth\n"
+        "except ImportError:\n"
+        "    pass\n"
+        "import core.converter"
+    ),
+    "lazy core.converter": "import core.converter",
+    "lazy app.main": "import app.main",
+}
+
+
+def time_import(code: str, runs: int) -> float:
+    """Return the median seconds to run ``code`` in a fresh interpreter."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=BACKEND_DIR,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = time_import("pass", args.runs)
+    print(f"{'interpreter only':<24} {baseline * 1000:8.1f} ms")
+    for name, code in SCENARIOS.items():
+        try:
+            elapsed = time_import(code, args.runs)
+        except subprocess.CalledProcessError:
+            print(f"{name:<24} {'failed':>8}")
+            continue
+        print(f"{name:<24} {elapsed * 1000:8.1f} ms  (+{(elapsed - baseline) * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
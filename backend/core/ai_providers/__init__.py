@@ -1,18 +1,89 @@
 """
 Multi AI Provider Support
 Gemini, OpenAI, Anthropic Claude, xAI Grok
+
+Provider modules (and their SDKs) are imported lazily on first use so that
+a request only pays for the provider it actually selects.
 """
 
-from .base import AIProvider
-from .gemini import GeminiProvider
-from .openai import OpenAIProvider
-from .anthropic import AnthropicProvider
-from .grok import GrokProvider
+import importlib
+from typing import Dict, Optional, Tuple, Type
+
+from .base import AIProvider, StopCondition, NOTE_SECTIONS
+
+# name -> (module, class name, default model)
+PROVIDER_REGISTRY: Dict[str, Tuple[str, str, str]] = {
+    'gemini': ('.gemini', 'GeminiProvider', 'gemini-2.5-flash'),
+    'openai': ('.openai', 'OpenAIProvider', 'gpt-4o'),
+    'anthropic': ('.anthropic', 'AnthropicProvider', 'claude-3-5-sonnet-20241022'),
+    'grok': ('.grok', 'GrokProvider', 'grok-4.1-fast'),
+}
+
+PROVIDER_ALIASES: Dict[str, str] = {
+    'claude': 'anthropic',
+    'xai': 'grok',
+}
+
+_CLASS_TO_PROVIDER = {entry[1]: name for name, entry in PROVIDER_REGISTRY.items()}
+
+
+def resolve_provider_name(name: str) -> str:
+    """
+    Normalize a provider name, resolving aliases.
+
+    Raises:
+        ValueError: If the provider is not registered
+    """
+    key = name.lower()
+    key = PROVIDER_ALIASES.get(key, key)
+    if key not in PROVIDER_REGISTRY:
+        raise ValueError(f"지원하지 않는 AI 프로바이더입니다: {name}")
+    return key
+
+
+def get_provider_class(name: str) -> Type[AIProvider]:
+    """Import and return the provider class registered under ``name``."""
+    module_name, class_name, _ = PROVIDER_REGISTRY[resolve_provider_name(name)]
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, class_name)
+
+
+def create_provider(name: str, api_key: str, model: Optional[str] = None) -> AIProvider:
+    """
+    Instantiate a provider by name.
+
+    Args:
+        name: Provider name or alias (e.g. 'gemini', 'claude')
+        api_key: API key for the provider
+        model: Model identifier (default: the provider's registered default)
+
+    Returns:
+        Initialized AIProvider
+    """
+    key = resolve_provider_name(name)
+    provider_cls = get_provider_class(key)
+    return provider_cls(api_key, model or PROVIDER_REGISTRY[key][2])
+
+
+def __getattr__(attr: str):
+    # Keep `from core.ai_providers import GeminiProvider` working without
+    # importing every SDK up front.
+    if attr in _CLASS_TO_PROVIDER:
+        return get_provider_class(_CLASS_TO_PROVIDER[attr])
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+
 
 __all__ = [
     'AIProvider',
+    'StopCondition',
+    'NOTE_SECTIONS',
     'GeminiProvider',
     'OpenAIProvider',
     'AnthropicProvider',
     'GrokProvider',
+    'PROVIDER_REGISTRY',
+    'PROVIDER_ALIASES',
+    'resolve_provider_name',
+    'get_provider_class',
+    'create_provider',
 ]
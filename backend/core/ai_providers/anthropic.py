@@ -5,7 +5,7 @@ Vision API for slide analysis and speaker notes generation
 
 import base64
 import io
-from typing import Optional
+from typing import Iterator, Optional
 from PIL import Image
 
 try:
@@ -48,51 +48,82 @@ class AnthropicProvider(AIProvider):
         image.save(buffer, format='PNG')
         return base64.b64encode(buffer.getvalue()).decode('utf-8')
 
+    def _build_messages(
+        self,
+        image: Optional[Image.Image],
+        context: Optional[str],
+        page_text: Optional[str] = None
+    ) -> list:
+        """Build the messages payload for a slide."""
+        prompt = self._get_prompt(context, page_text, has_image=image is not None)
+        content = []
+
+        if image is not None:
+            image_b64 = self._image_to_base64(image)
+            content.append({
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": "image/png",
+                    "data": image_b64
+                }
+            })
+
+        content.append({
+            "type": "text",
+            "text": prompt
+        })
+
+        return [
+            {
+                "role": "user",
+                "content": content
+            }
+        ]
+
     def analyze_slide(
         self,
-        image: Image.Image,
-        context: Optional[str] = None
+        image: Optional[Image.Image],
+        context: Optional[str] = None,
+        page_text: Optional[str] = None
     ) -> str:
         """
         Analyze slide image using Claude Vision.
 
         Args:
-            image: PIL Image of the slide
+            image: PIL Image of the slide, or None for text-only input
             context: Optional context materials
+            page_text: Optional text extracted from the slide
 
         Returns:
             Generated speaker notes
         """
-        prompt = self._get_prompt(context)
-        image_b64 = self._image_to_base64(image)
-
         message = self.client.messages.create(
             model=self.model,
             max_tokens=2000,
             timeout=30.0,  # Set explicit timeout of 30 seconds per slide
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "image/png",
-                                "data": image_b64
-                            }
-                        },
-                        {
-                            "type": "text",
-                            "text": prompt
-                        }
-                    ]
-                }
-            ]
+            messages=self._build_messages(image, context, page_text)
         )
 
         return message.content[0].text
 
+    def analyze_slide_stream(
+        self,
+        image: Optional[Image.Image],
+        context: Optional[str] = None,
+        page_text: Optional[str] = None
+    ) -> Iterator[str]:
+        """Stream speaker notes from Claude Vision."""
+        # Leaving the context manager closes the HTTP stream
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=2000,
+            timeout=30.0,
+            messages=self._build_messages(image, context, page_text)
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
+
     def get_available_models(self) -> list[str]:
         """Get available Claude models."""
         return self.MODELS
@@ -3,11 +3,71 @@ AI Provider Base Class
 Abstract interface for multi-provider AI Vision support
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, Iterator, List, Optional
 from PIL import Image
 
 
+# Section headings requested by the default prompt (see _get_prompt)
+NOTE_SECTIONS = ["핵심 메시지", "상세 설명", "전환 멘트", "예상 질문", "발표 팁"]
+
+
+class StopCondition:
+    """
+    Decides when a streamed completion is good enough to cancel early.
+
+    Generation stops once ``max_chars`` characters have arrived, or once
+    every heading in ``sections`` has appeared and a further heading or
+    separator starts after the last one: the expected notes are complete
+    and whatever follows (extra sections, closing remarks) is cut off.
+    A completion that simply ends after the last section runs to the end.
+
+    Marker detection is a heuristic: a sub-heading inside the last section
+    written like a section heading (e.g. ``**강조**:``) also ends it.
+    """
+
+    # Start of a line that opens a new block: markdown heading, numbered or
+    # "**label**:" heading (the prompt's format), or a horizontal rule
+    BLOCK_MARKER = re.compile(
+        r"^[ \t]*(?:#{1,6}\s|\d+\.\s*\*\*|\*\*[^*\n]+\*\*\s*:|(?:-{3,}|\*{3,}|_{3,})[ \t]*$)",
+        re.MULTILINE
+    )
+
+    def __init__(self, max_chars: Optional[int] = None, sections: Optional[List[str]] = None):
+        if max_chars is not None and max_chars <= 0:
+            raise ValueError("notes_max_chars must be a positive number")
+        self.max_chars = max_chars
+        self.sections = sections
+
+    def _sections_end(self, text: str) -> Optional[int]:
+        """Offset of the first block marker after the last expected section, if any."""
+        if not self.sections:
+            return None
+        positions = [text.find(section) for section in self.sections]
+        if min(positions) < 0:
+            return None
+        # Skip the line holding the last section's own heading
+        line_end = text.find("\n", max(positions))
+        if line_end < 0:
+            return None
+        match = self.BLOCK_MARKER.search(text, line_end + 1)
+        return match.start() if match else None
+
+    def is_met(self, text: str) -> bool:
+        if self.max_chars is not None and len(text) >= self.max_chars:
+            return True
+        return self._sections_end(text) is not None
+
+    def truncate(self, text: str) -> str:
+        end = self._sections_end(text)
+        if end is not None:
+            text = text[:end].rstrip()
+        if self.max_chars is not None:
+            text = text[:self.max_chars]
+        return text
+
+
 class AIProvider(ABC):
     """Abstract base class for AI providers with Vision capabilities."""
 
@@ -25,21 +85,87 @@ class AIProvider(ABC):
     @abstractmethod
     def analyze_slide(
         self,
-        image: Image.Image,
-        context: Optional[str] = None
+        image: Optional[Image.Image],
+        context: Optional[str] = None,
+        page_text: Optional[str] = None
     ) -> str:
         """
         Analyze a slide image and generate speaker notes.
 
         Args:
-            image: PIL Image of the slide
+            image: PIL Image of the slide, or None for text-only input
             context: Optional context materials to enhance notes
+            page_text: Optional text extracted from the slide's PDF text layer
 
         Returns:
             Generated speaker notes as string
         """
         pass
 
+    def analyze_slide_stream(
+        self,
+        image: Optional[Image.Image],
+        context: Optional[str] = None,
+        page_text: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream speaker notes as text chunks.
+
+        Providers override this with their SDK's streaming API; closing the
+        iterator cancels the underlying request. The default falls back to
+        a single chunk from analyze_slide.
+
+        Args:
+            image: PIL Image of the slide, or None for text-only input
+            context: Optional context materials
+            page_text: Optional extracted slide text
+
+        Yields:
+            Successive text chunks
+        """
+        yield self.analyze_slide(image, context, page_text)
+
+    def generate_notes(
+        self,
+        image: Optional[Image.Image],
+        context: Optional[str] = None,
+        on_progress: Optional[Callable[[str], None]] = None,
+        stop: Optional[StopCondition] = None,
+        page_text: Optional[str] = None
+    ) -> str:
+        """
+        Generate notes, streaming when a listener or stop condition is given.
+
+        Args:
+            image: PIL Image of the slide, or None for text-only input
+            context: Optional context materials
+            on_progress: Called with the accumulated partial notes after each chunk
+            stop: Optional condition that cancels generation early
+            page_text: Optional extracted slide text
+
+        Returns:
+            Generated speaker notes
+        """
+        if on_progress is None and stop is None:
+            return self.analyze_slide(image, context, page_text)
+
+        text = ""
+        stream = self.analyze_slide_stream(image, context, page_text)
+        try:
+            for chunk in stream:
+                if not chunk:
+                    continue
+                text += chunk
+                if on_progress:
+                    on_progress(text)
+                if stop and stop.is_met(text):
+                    break
+        finally:
+            # Closing the generator closes the SDK stream and cancels the request
+            stream.close()
+
+        return stop.truncate(text) if stop else text
+
     @abstractmethod
     def get_available_models(self) -> list[str]:
         """
@@ -50,17 +176,29 @@ class AIProvider(ABC):
         """
         pass
 
-    def _get_prompt(self, context: Optional[str] = None) -> str:
+    def _get_prompt(
+        self,
+        context: Optional[str] = None,
+        page_text: Optional[str] = None,
+        has_image: bool = True
+    ) -> str:
         """
         Get the speaker notes generation prompt.
 
         Args:
             context: Optional context materials
+            page_text: Optional text extracted from the slide
+            has_image: Whether a slide image accompanies the prompt
 
         Returns:
             Complete prompt string
         """
-        base_prompt = """이 슬라이드 이미지를 분석하고 발표자 노트를 작성해주세요.
+        if has_image:
+            intro = "이 슬라이드 이미지를 분석하고 발표자 노트를 작성해주세요."
+        else:
+            intro = "아래에 제공된 슬라이드 텍스트를 분석하고 발표자 노트를 작성해주세요."
+
+        base_prompt = intro + """
 
 발표자 노트에 포함할 내용:
 1. **핵심 메시지**: 이 슬라이드에서 전달해야 할 가장 중요한 포인트
@@ -74,6 +212,14 @@ class AIProvider(ABC):
 - 2-3분 분량의 발표 스크립트
 - 읽기 쉽게 bullet point 활용"""
 
+        if page_text:
+            base_prompt += f"""
+
+---
+슬라이드 추출 텍스트 (Slide Text):
+{page_text}
+---"""
+
         if context:
             context_section = f"""
 
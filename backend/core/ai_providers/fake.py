@@ -0,0 +1,97 @@
+"""
+Fake AI Provider
+Offline stand-in with simulated latency for benchmarks and local development.
+Not registered in PROVIDER_REGISTRY, so the API never selects it.
+"""
+
+import math
+import time
+from typing import Iterator, Optional
+from PIL import Image
+
+from .base import AIProvider, NOTE_SECTIONS
+
+
+class FakeProvider(AIProvider):
+    """Returns canned notes after a configurable delay."""
+
+    MODELS = ["fake"]
+
+    def __init__(
+        self,
+        api_key: str = "",
+        model: str = "fake",
+        latency: float = 0.5,
+        chunk_delay: float = 0.0,
+        input_token_latency: float = 0.0
+    ):
+        """
+        Initialize fake provider.
+
+        Args:
+            api_key: Ignored
+            model: Model name reported by the provider
+            latency: Seconds to wait before the first chunk
+            chunk_delay: Seconds to wait between streamed chunks
+            input_token_latency: Extra seconds per estimated input token
+        """
+        super().__init__(api_key, model)
+        self.latency = latency
+        self.chunk_delay = chunk_delay
+        self.input_token_latency = input_token_latency
+        self.calls = 0
+        self.input_tokens = 0
+
+    @staticmethod
+    def estimate_input_tokens(prompt: str, image: Optional[Image.Image]) -> int:
+        """
+        Rough input token estimate: ~2 characters per text token (Korean
+        prompts tokenize densely) and width*height/750 per image, capped
+        at 1600 as vision APIs downscale large images.
+        """
+        tokens = math.ceil(len(prompt) / 2)
+        if image is not None:
+            tokens += min(1600, math.ceil(image.width * image.height / 750))
+        return tokens
+
+    def _simulate_request(
+        self,
+        image: Optional[Image.Image],
+        context: Optional[str],
+        page_text: Optional[str]
+    ) -> None:
+        prompt = self._get_prompt(context, page_text, has_image=image is not None)
+        tokens = self.estimate_input_tokens(prompt, image)
+        self.calls += 1
+        self.input_tokens += tokens
+        time.sleep(self.latency + tokens * self.input_token_latency)
+
+    def _chunks(self, image: Optional[Image.Image], context: Optional[str]) -> list[str]:
+        header = f"슬라이드 {image.width}x{image.height}\n\n" if image is not None else "슬라이드 텍스트\n\n"
+        return [header] + [f"**{section}**: " + "내용 " * 20 + "\n\n" for section in NOTE_SECTIONS]
+
+    def analyze_slide(
+        self,
+        image: Optional[Image.Image],
+        context: Optional[str] = None,
+        page_text: Optional[str] = None
+    ) -> str:
+        """Return canned notes after the simulated latency."""
+        self._simulate_request(image, context, page_text)
+        return "".join(self._chunks(image, context))
+
+    def analyze_slide_stream(
+        self,
+        image: Optional[Image.Image],
+        context: Optional[str] = None,
+        page_text: Optional[str] = None
+    ) -> Iterator[str]:
+        """Stream canned notes, one section per chunk."""
+        self._simulate_request(image, context, page_text)
+        for chunk in self._chunks(image, context):
+            yield chunk
+            time.sleep(self.chunk_delay)
+
+    def get_available_models(self) -> list[str]:
+        """Get available fake models."""
+        return self.MODELS
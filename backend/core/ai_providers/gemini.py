@@ -3,7 +3,7 @@ Google Gemini AI Provider
 Vision API for slide analysis and speaker notes generation
 """
 
-from typing import Optional
+from typing import Iterator, Optional
 from PIL import Image
 
 try:
@@ -43,29 +43,55 @@ class GeminiProvider(AIProvider):
 
     def analyze_slide(
         self,
-        image: Image.Image,
-        context: Optional[str] = None
+        image: Optional[Image.Image],
+        context: Optional[str] = None,
+        page_text: Optional[str] = None
     ) -> str:
         """
         Analyze slide image using Gemini Vision.
 
         Args:
-            image: PIL Image of the slide
+            image: PIL Image of the slide, or None for text-only input
             context: Optional context materials
+            page_text: Optional text extracted from the slide
 
         Returns:
             Generated speaker notes
         """
-        prompt = self._get_prompt(context)
+        prompt = self._get_prompt(context, page_text, has_image=image is not None)
 
         # Gemini accepts PIL Image directly
         response = self.client.generate_content(
-            [prompt, image],
+            [prompt, image] if image is not None else [prompt],
             request_options={"timeout": 30}
         )
 
         return response.text
 
+    def analyze_slide_stream(
+        self,
+        image: Optional[Image.Image],
+        context: Optional[str] = None,
+        page_text: Optional[str] = None
+    ) -> Iterator[str]:
+        """Stream speaker notes from Gemini Vision."""
+        prompt = self._get_prompt(context, page_text, has_image=image is not None)
+
+        response = self.client.generate_content(
+            [prompt, image] if image is not None else [prompt],
+            stream=True,
+            request_options={"timeout": 30}
+        )
+        for chunk in response:
+            # Blocked or metadata-only chunks have no candidates, and
+            # chunk.parts / chunk.text raise ValueError on those
+            if not chunk.candidates:
+                continue
+            content = chunk.candidates[0].content
+            text = "".join(getattr(part, "text", "") for part in (content.parts if content else []))
+            if text:
+                yield text
+
     def get_available_models(self) -> list[str]:
         """Get available Gemini models."""
         return self.MODELS
@@ -5,7 +5,7 @@ Vision API for slide analysis and speaker notes generation
 
 import base64
 import io
-from typing import Optional
+from typing import Iterator, Optional
 from PIL import Image
 
 try:
@@ -48,49 +48,84 @@ class OpenAIProvider(AIProvider):
         image.save(buffer, format='PNG')
         return base64.b64encode(buffer.getvalue()).decode('utf-8')
 
+    def _build_messages(
+        self,
+        image: Optional[Image.Image],
+        context: Optional[str],
+        page_text: Optional[str] = None
+    ) -> list:
+        """Build the chat messages payload for a slide."""
+        prompt = self._get_prompt(context, page_text, has_image=image is not None)
+        content = [
+            {
+                "type": "text",
+                "text": prompt
+            }
+        ]
+
+        if image is not None:
+            image_b64 = self._image_to_base64(image)
+            content.append({
+                "type": "image_url",
+                "image_url": {
+                    "url": f"data:image/png;base64,{image_b64}"
+                }
+            })
+
+        return [
+            {
+                "role": "user",
+                "content": content
+            }
+        ]
+
     def analyze_slide(
         self,
-        image: Image.Image,
-        context: Optional[str] = None
+        image: Optional[Image.Image],
+        context: Optional[str] = None,
+        page_text: Optional[str] = None
     ) -> str:
         """
         Analyze slide image using OpenAI Vision.
 
         Args:
-            image: PIL Image of the slide
+            image: PIL Image of the slide, or None for text-only input
             context: Optional context materials
+            page_text: Optional text extracted from the slide
 
         Returns:
             Generated speaker notes
         """
-        prompt = self._get_prompt(context)
-        image_b64 = self._image_to_base64(image)
-
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": prompt
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{image_b64}"
-                            }
-                        }
-                    ]
-                }
-            ],
+            messages=self._build_messages(image, context, page_text),
             max_tokens=2000,
             timeout=30.0  # Set explicit timeout of 30 seconds per slide
         )
 
         return response.choices[0].message.content
 
+    def analyze_slide_stream(
+        self,
+        image: Optional[Image.Image],
+        context: Optional[str] = None,
+        page_text: Optional[str] = None
+    ) -> Iterator[str]:
+        """Stream speaker notes from OpenAI Vision."""
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(image, context, page_text),
+            max_tokens=2000,
+            timeout=30.0,
+            stream=True
+        )
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            stream.close()
+
     def get_available_models(self) -> list[str]:
         """Get available OpenAI models."""
         return self.MODELS
@@ -0,0 +1,250 @@
+"""
+Batch Conversion
+Converts many PDFs with one shared provider client, one render worker pool
+and one global LLM concurrency budget, so slides from every document are
+scheduled together instead of one request at a time.
+"""
+
+import io
+import json
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+import fitz  # PyMuPDF
+
+from .converter import SaaSConverter
+
+
+class BatchResult:
+    """Outcome of converting one document in a batch."""
+
+    def __init__(
+        self,
+        name: str,
+        source: Optional[str] = None,
+        status: str = "pending",
+        slides: int = 0,
+        error: Optional[str] = None
+    ):
+        self.name = name
+        self.source = source or name
+        self.status = status
+        self.slides = slides
+        self.error = error
+        self.data: Optional[bytes] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "source": self.source,
+            "status": self.status,
+            "slides": self.slides,
+            "error": self.error,
+        }
+
+
+def client_error_message(error: Exception) -> str:
+    """
+    Describe a per-document failure without leaking server details such as
+    temp file paths; the full exception is logged server-side.
+    """
+    if isinstance(error, fitz.FileDataError):
+        return "Could not open the PDF (the file is damaged or not a PDF)."
+    if isinstance(error, ValueError):
+        # Raised by our own validation (e.g. page ranges) with user-facing text
+        return str(error)
+    return "Conversion failed."
+
+
+class BatchConverter:
+    """Runs a shared SaaSConverter over many documents."""
+
+    def __init__(
+        self,
+        converter: SaaSConverter,
+        render_workers: int = 2,
+        llm_concurrency: int = 8,
+        max_documents_in_flight: int = 4,
+        progress_callback: Optional[Callable[[str, int, str], None]] = None
+    ):
+        """
+        Args:
+            converter: Configured converter; its AI provider client is shared by all documents
+            render_workers: Maximum documents rendering or assembling at once
+            llm_concurrency: Maximum in-flight notes requests across the whole batch
+            max_documents_in_flight: Maximum documents whose rendered pages are held
+                in memory at once (rendered but not yet assembled)
+            progress_callback: Called as ``(output_name, slide_idx, partial_notes)``
+                while notes stream; takes precedence over the shared converter's
+                own callback, which cannot tell documents apart
+        """
+        self.converter = converter
+        self.render_workers = max(1, render_workers)
+        self.llm_concurrency = max(1, llm_concurrency)
+        self.max_documents_in_flight = max(1, max_documents_in_flight)
+        self.progress_callback = progress_callback
+
+    def _progress_listener(self, name: str, idx: int) -> Optional[Callable[[str], None]]:
+        if not self.progress_callback:
+            return None
+        return lambda partial: self.progress_callback(name, idx, partial)
+
+    def convert_many(
+        self,
+        documents: List[Tuple[str, Union[str, Path]]],
+        generate_notes: bool = True,
+        context: Optional[str] = None,
+        pages: Optional[str] = None,
+        sources: Optional[List[str]] = None
+    ) -> List[BatchResult]:
+        """
+        Convert every ``(output_name, pdf_path)`` pair.
+
+        Up to ``max_documents_in_flight`` documents are processed at once;
+        each is rendered, its slides are queued on the shared LLM pool, and
+        its PPTX is assembled as soon as its last note finishes, after which
+        its images are released. Rendering and assembly are limited to
+        ``render_workers`` at a time. Failures are recorded per document and
+        never abort the batch.
+
+        Args:
+            documents: ``(output_name, pdf_path)`` pairs
+            sources: Optional original input names reported in each result
+
+        Returns:
+            One BatchResult per document, in input order
+        """
+        results = [
+            BatchResult(name, source=sources[i] if sources else None)
+            for i, (name, _) in enumerate(documents)
+        ]
+        with_notes = generate_notes and self.converter.ai_provider is not None
+        render_slots = threading.Semaphore(self.render_workers)
+
+        with ThreadPoolExecutor(self.max_documents_in_flight) as document_pool, \
+                ThreadPoolExecutor(self.llm_concurrency) as llm_pool:
+
+            def process(result: BatchResult, path: Union[str, Path]) -> None:
+                try:
+                    with render_slots:
+                        images, page_texts = self._render(path, pages, with_notes)
+
+                    notes = None
+                    if with_notes and images:
+                        futures = [
+                            llm_pool.submit(
+                                self.converter.generate_slide_notes,
+                                img,
+                                idx,
+                                context,
+                                page_info=page_texts[idx] if page_texts else None,
+                                on_progress=self._progress_listener(result.name, idx)
+                            )
+                            for idx, img in enumerate(images)
+                        ]
+                        notes = [future.result() for future in futures]
+
+                    with render_slots, io.BytesIO() as buffer:
+                        self.converter.create_pptx(images, buffer, generate_notes=False, notes=notes)
+                        result.data = buffer.getvalue()
+                    result.slides = len(images)
+                    result.status = "ok"
+                except Exception as e:
+                    self._record_error(result, e)
+
+            for future in [document_pool.submit(process, result, path)
+                           for result, (_, path) in zip(results, documents)]:
+                future.result()
+
+        return results
+
+    @staticmethod
+    def _record_error(result: BatchResult, error: Exception) -> None:
+        print(f"Batch conversion failed for {result.source}: {error!r}")
+        result.status = "error"
+        result.error = client_error_message(error)
+        result.data = None
+
+    def _render(
+        self,
+        pdf_path: Union[str, Path],
+        pages: Optional[str],
+        with_notes: bool
+    ) -> Tuple[list, Optional[List[Tuple[str, bool]]]]:
+        """Render one document, extracting page text when the notes mode needs it."""
+        images = self.converter.convert_pdf_to_images(pdf_path, pages)
+        page_texts = None
+        if with_notes and self.converter.notes_input != "image":
+            page_texts = self.converter.extract_page_texts(pdf_path, pages)
+        return images, page_texts
+
+
+def extract_pdfs_from_zip(
+    zip_path: Union[str, Path],
+    dest_dir: Union[str, Path],
+    max_files: int = 50,
+    max_total_bytes: int = 500 * 1024 * 1024
+) -> List[Tuple[str, Path]]:
+    """
+    Extract PDF members of a zip archive.
+
+    Returns:
+        ``(member_name, extracted_path)`` pairs; member names keep their
+        folder so same-named files remain distinguishable
+
+    Raises:
+        ValueError: If the archive exceeds the file count or size limits
+    """
+    dest_dir = Path(dest_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    with zipfile.ZipFile(zip_path) as archive:
+        members = [
+            info for info in archive.infolist()
+            if not info.is_dir()
+            and info.filename.lower().endswith(".pdf")
+            and not Path(info.filename).name.startswith(".")
+        ]
+        if len(members) > max_files:
+            raise ValueError(f"Too many PDFs in archive (max {max_files})")
+        if sum(info.file_size for info in members) > max_total_bytes:
+            raise ValueError("Archive contents exceed the size limit")
+
+        extracted = []
+        for n, info in enumerate(members):
+            # Never trust member paths; write to a flat, generated name
+            target = dest_dir / f"{n:04d}.pdf"
+            with archive.open(info) as src, open(target, "wb") as out:
+                out.write(src.read())
+            extracted.append((info.filename, target))
+        return extracted
+
+
+def unique_output_names(names: List[str], suffix: str = ".pptx") -> List[str]:
+    """Map input file names to distinct output names (``deck.pdf`` -> ``deck.pptx``)."""
+    used = set()
+    output = []
+    for name in names:
+        stem = Path(name).stem or "document"
+        candidate = f"{stem}{suffix}"
+        n = 2
+        while candidate in used:
+            candidate = f"{stem}_{n}{suffix}"
+            n += 1
+        used.add(candidate)
+        output.append(candidate)
+    return output
+
+
+def write_batch_zip(results: List[BatchResult], stream: BinaryIO) -> None:
+    """Write successful outputs plus a ``status.json`` manifest to a zip stream."""
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for result in results:
+            if result.data is not None:
+                # PPTX is already deflated internally
+                archive.writestr(result.name, result.data, compress_type=zipfile.ZIP_STORED)
+        status = {"files": [result.to_dict() for result in results]}
+        archive.writestr("status.json", json.dumps(status, ensure_ascii=False, indent=2))
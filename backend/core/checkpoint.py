@@ -0,0 +1,194 @@
+"""
+Job Checkpoints
+Per-slide progress (rendered pages, generated notes) persisted to disk so a
+retried conversion resumes from the last completed slide.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from PIL import Image
+
+_SAFE_JOB_ID = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
+
+
+class JobBusyError(RuntimeError):
+    """Raised when another running job holds the same checkpoint."""
+
+
+def scoped_job_id(job_id: str, owner: Optional[str]) -> str:
+    """
+    Map a client-supplied job id to a checkpoint id private to ``owner``,
+    so two users picking the same id never share a checkpoint.
+
+    Raises:
+        ValueError: If ``job_id`` is not a valid job id
+    """
+    if not _SAFE_JOB_ID.match(job_id):
+        raise ValueError(f"Invalid job id: {job_id}")
+    return hashlib.sha256(f"{owner or ''}\0{job_id}".encode()).hexdigest()[:32]
+
+
+def hash_file(path: Union[str, Path], chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint(settings: Dict[str, Any]) -> str:
+    """Stable hash of a settings dict."""
+    payload = json.dumps(settings, sort_keys=True, default=str).encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+class JobCheckpoint:
+    """
+    Checkpoint directory for one conversion job.
+
+    Layout::
+
+        <root>/<job_id>/manifest.json
+        <root>/<job_id>/slide_0000.png
+        ...
+
+    The manifest records the input/render fingerprint and the notes for
+    each finished slide. A mismatched render fingerprint resets the job;
+    a mismatched notes fingerprint (different provider/model/context)
+    drops only the stored notes.
+
+    An open checkpoint holds an exclusive lock on ``<job_id>/.lock`` until
+    ``close`` or ``discard``; the OS drops it if the process dies, so a
+    crashed job can be resumed while a concurrent one is refused.
+    """
+
+    MANIFEST = "manifest.json"
+    LOCK = ".lock"
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        job_id: str,
+        render_key: str,
+        notes_key: str
+    ):
+        """
+        Args:
+            root: Checkpoint root directory
+            job_id: Job identifier (letters, digits, '-' and '_')
+            render_key: Fingerprint of the input PDF and render settings
+            notes_key: Fingerprint of the notes settings
+
+        Raises:
+            ValueError: If ``job_id`` is invalid
+            JobBusyError: If another open checkpoint holds ``job_id``
+        """
+        if not _SAFE_JOB_ID.match(job_id):
+            raise ValueError(f"Invalid job id: {job_id}")
+
+        self.dir = Path(root) / job_id
+        self._lock_fd = self._acquire_lock()
+        try:
+            self.manifest = self._load_manifest()
+            self._check_keys(render_key, notes_key)
+        except BaseException:
+            self.close()
+            raise
+
+    def _acquire_lock(self) -> int:
+        lock_path = self.dir / self.LOCK
+        while True:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            try:
+                fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            except FileNotFoundError:
+                continue  # directory removed by a finishing job; recreate it
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                raise JobBusyError(f"Job {self.dir.name} is already running")
+            # A finishing job may have deleted the directory between our
+            # open and flock; only a lock on the current file counts
+            try:
+                if os.stat(lock_path).st_ino == os.fstat(fd).st_ino:
+                    return fd
+            except FileNotFoundError:
+                pass
+            os.close(fd)
+
+    def close(self) -> None:
+        """Release the job lock, keeping checkpointed data for a later retry."""
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    def _check_keys(self, render_key: str, notes_key: str) -> None:
+        if self.manifest.get("render_key") != render_key:
+            self.reset()
+            self.manifest = {"render_key": render_key, "notes_key": notes_key, "notes": {}}
+            self._save_manifest()
+        elif self.manifest.get("notes_key") != notes_key:
+            self.manifest["notes_key"] = notes_key
+            self.manifest["notes"] = {}
+            self._save_manifest()
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        try:
+            with open(self.dir / self.MANIFEST, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_manifest(self) -> None:
+        # Write-then-rename so a crash never leaves a truncated manifest
+        tmp_path = self.dir / (self.MANIFEST + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False)
+        os.replace(tmp_path, self.dir / self.MANIFEST)
+
+    def _image_path(self, idx: int) -> Path:
+        return self.dir / f"slide_{idx:04d}.png"
+
+    def load_image(self, idx: int) -> Optional[Image.Image]:
+        """Return the rendered image for slide ``idx``, or None if not checkpointed."""
+        path = self._image_path(idx)
+        try:
+            with Image.open(path) as img:
+                img.load()
+                return img.copy()
+        except (FileNotFoundError, OSError):
+            return None
+
+    def save_image(self, idx: int, image: Image.Image) -> None:
+        path = self._image_path(idx)
+        tmp_path = path.with_suffix(".png.tmp")
+        image.save(tmp_path, format="PNG")
+        os.replace(tmp_path, path)
+
+    def get_notes(self, idx: int) -> Optional[str]:
+        return self.manifest["notes"].get(str(idx))
+
+    def save_notes(self, idx: int, notes: str) -> None:
+        self.manifest["notes"][str(idx)] = notes
+        self._save_manifest()
+
+    def reset(self) -> None:
+        """Remove all checkpointed data for this job."""
+        for path in self.dir.iterdir():
+            if path.is_file() and path.name != self.LOCK:
+                os.remove(path)
+
+    def discard(self) -> None:
+        """Delete the checkpoint directory once the job has completed."""
+        # Removed while still locked, so no other job can adopt it half-deleted
+        shutil.rmtree(self.dir, ignore_errors=True)
+        self.close()
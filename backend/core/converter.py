@@ -1,16 +1,15 @@
+import math
 import os
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import BinaryIO, Callable, List, Optional, Tuple, Union
 import fitz  # PyMuPDF
 from PIL import Image
 import io
 from pptx import Presentation
 from pptx.util import Inches
 
-from .ai_providers.gemini import GeminiProvider
-from .ai_providers.openai import OpenAIProvider
-from .ai_providers.anthropic import AnthropicProvider
-from .ai_providers.grok import GrokProvider
+from .ai_providers import StopCondition, create_provider
+from .checkpoint import JobCheckpoint, fingerprint, hash_file
 
 class SaaSConverter:
     """
@@ -20,52 +19,315 @@ class SaaSConverter:
     SLIDE_WIDTH = Inches(10)
     SLIDE_HEIGHT = Inches(5.625)
 
+    # Auto-DPI: smallest text should be at least this many pixels tall
+    TEXT_PX_TARGET = 20
+    # Short spans within this fraction of the page top/bottom are marginal
+    TEXT_MARGIN_BAND = 0.08
+    MARGINAL_SPAN_CHARS = 12
+    # Pages with more vector paths than this are rendered at the base DPI;
+    # pages with fewer (but some) drawings get this fraction of it
+    VECTOR_HEAVY_PATHS = 50
+    VECTOR_DPI_RATIO = 0.75
+    # Chosen DPIs are rounded up to half-zoom steps (36 DPI = 0.5x); odd
+    # scale factors rasterize glyphs unevenly and compress worse as PNG
+    DPI_STEP = 36
+
+    # Notes input modes: the full image, extracted text plus a downscaled
+    # image, or text only for text-dominant pages (hybrid otherwise)
+    NOTES_INPUT_MODES = ("image", "hybrid", "text")
+    # A page is text-dominant with at least this much text and little imagery
+    # (raster images or vector drawings such as charts and diagrams)
+    TEXT_DOMINANT_MIN_CHARS = 200
+    TEXT_DOMINANT_MAX_IMAGE_COVERAGE = 0.2
+    TEXT_DOMINANT_MAX_DRAWINGS = 10
+
     def __init__(
         self, 
         provider: str = 'gemini',
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         dpi: int = 144, 
-        remove_watermark: bool = True
+        remove_watermark: bool = True,
+        auto_dpi: bool = False,
+        min_dpi: int = 72,
+        checkpoint_dir: Optional[Union[str, Path]] = None,
+        notes_max_chars: Optional[int] = None,
+        notes_stop_sections: Optional[List[str]] = None,
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+        notes_input: str = "image",
+        hybrid_image_max_side: int = 768
     ):
+        if notes_input not in self.NOTES_INPUT_MODES:
+            raise ValueError(f"Unsupported notes input mode: {notes_input}")
+        if dpi < 1:
+            raise ValueError("dpi must be at least 1")
+        # dpi is also the auto-DPI ceiling; min_dpi is its floor
+        if auto_dpi and not 1 <= min_dpi <= dpi:
+            raise ValueError(f"min_dpi must be between 1 and dpi ({dpi})")
+
         self.dpi = dpi
         self.remove_watermark = remove_watermark
+        self.auto_dpi = auto_dpi
+        self.min_dpi = min_dpi
+        self.checkpoint_dir = checkpoint_dir
+        # Streaming notes: progress_callback(slide_idx, partial_notes) and an
+        # optional early-stop condition
+        self.progress_callback = progress_callback
+        self.stop_condition = None
+        if notes_max_chars is not None or notes_stop_sections:
+            self.stop_condition = StopCondition(notes_max_chars, notes_stop_sections)
+        self.notes_input = notes_input
+        self.hybrid_image_max_side = hybrid_image_max_side
         self.provider_name = provider.lower()
         
-        # Initialize AI Provider
+        # Initialize AI Provider (only the selected SDK is imported)
         if api_key:
-            if self.provider_name == 'gemini':
-                self.ai_provider = GeminiProvider(api_key, model or "gemini-2.5-flash")
-            elif self.provider_name == 'openai':
-                self.ai_provider = OpenAIProvider(api_key, model or "gpt-4o")
-            elif self.provider_name in ['anthropic', 'claude']:
-                self.ai_provider = AnthropicProvider(api_key, model or "claude-3-5-sonnet-20241022")
-            elif self.provider_name in ['grok', 'xai']:
-                self.ai_provider = GrokProvider(api_key, model or "grok-4.1-fast")
-            else:
-                raise ValueError(f"지원하지 않는 AI 프로바이더입니다: {provider}")
+            self.ai_provider = create_provider(self.provider_name, api_key, model)
         else:
             self.ai_provider = None
 
-    def convert_pdf_to_images(self, pdf_path: Union[str, Path]) -> List[Image.Image]:
-        """Convert PDF to images using PyMuPDF."""
+    @staticmethod
+    def parse_page_range(spec: Optional[str], page_count: int) -> List[int]:
+        """
+        Parse a 1-based page range spec such as "1-3,5,8-" into 0-based indices.
+
+        Empty or None selects every page. Open-ended ranges ("8-", "-3") run
+        to the last/from the first page. Duplicates are dropped, order kept.
+        """
+        if not spec or not spec.strip():
+            return list(range(page_count))
+
+        indices: List[int] = []
+        seen = set()
+        for part in spec.split(','):
+            part = part.strip()
+            if not part:
+                continue
+            try:
+                if '-' in part:
+                    start_s, end_s = part.split('-', 1)
+                    start = int(start_s) if start_s.strip() else 1
+                    end = int(end_s) if end_s.strip() else page_count
+                else:
+                    start = end = int(part)
+            except ValueError:
+                raise ValueError(f"잘못된 페이지 범위입니다: {part}")
+
+            if start < 1 or end > page_count or start > end:
+                raise ValueError(
+                    f"페이지 범위가 문서 범위(1-{page_count})를 벗어났습니다: {part}"
+                )
+            for i in range(start - 1, end):
+                if i not in seen:
+                    seen.add(i)
+                    indices.append(i)
+
+        if not indices:
+            raise ValueError(f"선택된 페이지가 없습니다: {spec}")
+        return indices
+
+    def select_dpi(self, page: "fitz.Page") -> int:
+        """
+        Pick the lowest DPI that keeps a page legible, between ``min_dpi``
+        and the base DPI.
+
+        Auto mode never renders above the base DPI (``self.dpi``); it only
+        lowers resolution where nothing on the page needs it.
+
+        - Text: render the smallest body font at >= TEXT_PX_TARGET pixels.
+          Short spans in the top/bottom margins (page numbers, footers)
+          are ignored so they don't drive the whole page.
+        - Vector drawings: any drawing sets a floor of VECTOR_DPI_RATIO of
+          the base DPI; vector-heavy pages keep the base DPI.
+        - Images: every embedded image's native DPI (capped at the base
+          DPI) is a candidate, so photos are never downsampled below their
+          own resolution.
+        """
+        candidates = []
+
+        margin = page.rect.height * self.TEXT_MARGIN_BAND
+        sizes = []
+        for block in page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT)["blocks"]:
+            for line in block.get("lines", []):
+                for span in line["spans"]:
+                    text = span["text"].strip()
+                    if not text or span["size"] <= 0:
+                        continue
+                    y0, y1 = span["bbox"][1], span["bbox"][3]
+                    in_margin = y1 <= page.rect.y0 + margin or y0 >= page.rect.y1 - margin
+                    if in_margin and len(text) < self.MARGINAL_SPAN_CHARS:
+                        continue
+                    sizes.append(span["size"])
+        if sizes:
+            candidates.append(self.TEXT_PX_TARGET * 72 / min(sizes))
+
+        drawings = len(page.get_cdrawings())
+        if drawings > self.VECTOR_HEAVY_PATHS:
+            candidates.append(self.dpi)
+        elif drawings:
+            candidates.append(self.dpi * self.VECTOR_DPI_RATIO)
+
+        _, native_dpis = self._image_stats(page)
+        candidates.extend(native_dpis)
+
+        if not candidates:
+            return self.min_dpi
+        needed = max(self.min_dpi, *candidates)
+        snapped = math.ceil(needed / self.DPI_STEP) * self.DPI_STEP
+        return int(min(self.dpi, max(self.min_dpi, snapped)))
+
+    @staticmethod
+    def _image_stats(page: "fitz.Page") -> Tuple[float, List[float]]:
+        """Return (fraction of page covered by images, native DPI of each image)."""
+        page_area = abs(page.rect) or 1
+        coverage = 0.0
+        native_dpis = []
+        for info in page.get_image_info():
+            bbox = fitz.Rect(info["bbox"]) & page.rect
+            if bbox.is_empty:
+                continue
+            coverage += abs(bbox) / page_area
+            native_dpis.append(info["width"] * 72 / bbox.width)
+        return coverage, native_dpis
+
+    def extract_page_text(self, page: "fitz.Page") -> Tuple[str, bool]:
+        """
+        Extract a page's text layer.
+
+        Returns:
+            (text, text_dominant) where text_dominant means the text alone
+            carries the slide (enough text, little embedded imagery and
+            at most a few vector paths, e.g. rules or bullet markers)
+        """
+        text = page.get_text("text").strip()
+        if len(text) < self.TEXT_DOMINANT_MIN_CHARS:
+            return text, False
+        coverage, _ = self._image_stats(page)
+        text_dominant = (
+            coverage <= self.TEXT_DOMINANT_MAX_IMAGE_COVERAGE
+            and len(page.get_cdrawings()) <= self.TEXT_DOMINANT_MAX_DRAWINGS
+        )
+        return text, text_dominant
+
+    def extract_page_texts(
+        self,
+        pdf_path: Union[str, Path],
+        pages: Optional[str] = None
+    ) -> List[Tuple[str, bool]]:
+        """Extract text for each selected page (same order as convert_pdf_to_images)."""
         doc = fitz.open(pdf_path)
-        images = []
-        
-        for i in range(len(doc)):
-            page = doc.load_page(i)
-            # Render page to a pixmap
-            pix = page.get_pixmap(matrix=fitz.Matrix(self.dpi/72, self.dpi/72))
-            img_data = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_data))
-            
-            if self.remove_watermark:
-                img = self._remove_watermark(img)
-                
-            images.append(img)
-            
-        doc.close()
-        return images
+        try:
+            indices = self.parse_page_range(pages, len(doc))
+            return [self.extract_page_text(doc.load_page(i)) for i in indices]
+        finally:
+            doc.close()
+
+    def _notes_payload(
+        self,
+        image: Image.Image,
+        page_info: Optional[Tuple[str, bool]]
+    ) -> Tuple[Optional[Image.Image], Optional[str]]:
+        """Pick the (image, page_text) pair sent to the provider for one slide."""
+        if self.notes_input == "image" or not page_info or not page_info[0]:
+            return image, None
+
+        text, text_dominant = page_info
+        if self.notes_input == "text" and text_dominant:
+            return None, text
+
+        small = image.copy()
+        small.thumbnail((self.hybrid_image_max_side, self.hybrid_image_max_side))
+        return small, text
+
+    def _render_page(self, page: "fitz.Page", dpi: int) -> Image.Image:
+        """Render a single page to an RGB PIL Image."""
+        pix = page.get_pixmap(matrix=fitz.Matrix(dpi/72, dpi/72), alpha=False)
+        # Wrap raw samples directly instead of a PNG encode/decode round-trip
+        img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
+        if self.remove_watermark:
+            img = self._remove_watermark(img)
+        return img
+
+    def convert_pdf_to_images(
+        self,
+        pdf_path: Union[str, Path],
+        pages: Optional[str] = None,
+        dpi: Optional[int] = None,
+        checkpoint: Optional[JobCheckpoint] = None
+    ) -> List[Image.Image]:
+        """
+        Convert PDF to images using PyMuPDF.
+
+        Args:
+            pdf_path: Input PDF
+            pages: Optional 1-based page range spec (e.g. "1-3,5"); all pages if omitted
+            dpi: Render resolution (default: self.dpi, or per-page when auto_dpi is on)
+            checkpoint: Optional job checkpoint; already rendered slides are reused
+        """
+        doc = fitz.open(pdf_path)
+        try:
+            indices = self.parse_page_range(pages, len(doc))
+            images = []
+            for n, i in enumerate(indices):
+                if checkpoint:
+                    cached = checkpoint.load_image(n)
+                    if cached is not None:
+                        images.append(cached)
+                        continue
+
+                page = doc.load_page(i)
+                if dpi:
+                    page_dpi = dpi
+                elif self.auto_dpi:
+                    page_dpi = self.select_dpi(page)
+                else:
+                    page_dpi = self.dpi
+                img = self._render_page(page, page_dpi)
+                if checkpoint:
+                    try:
+                        checkpoint.save_image(n, img)
+                    except OSError as e:
+                        print(f"Checkpoint write failed for slide {n+1}: {e}")
+                images.append(img)
+            return images
+        finally:
+            doc.close()
+
+    def render_preview(
+        self,
+        pdf_path: Union[str, Path],
+        pages: Optional[str] = None,
+        dpi: int = 36
+    ) -> List[Image.Image]:
+        """Render low-DPI thumbnails for a quick look before a full conversion."""
+        return self.convert_pdf_to_images(pdf_path, pages=pages, dpi=dpi)
+
+    @staticmethod
+    def create_contact_sheet(
+        images: List[Image.Image],
+        columns: int = 4,
+        padding: int = 8,
+        background: str = "white"
+    ) -> Image.Image:
+        """Tile thumbnails into a single grid image."""
+        if not images:
+            raise ValueError("No images to tile")
+
+        cell_w = max(img.width for img in images)
+        cell_h = max(img.height for img in images)
+        columns = max(1, min(columns, len(images)))
+        rows = (len(images) + columns - 1) // columns
+
+        sheet = Image.new(
+            "RGB",
+            (columns * cell_w + (columns + 1) * padding, rows * cell_h + (rows + 1) * padding),
+            background
+        )
+        for idx, img in enumerate(images):
+            row, col = divmod(idx, columns)
+            sheet.paste(img, (padding + col * (cell_w + padding), padding + row * (cell_h + padding)))
+        return sheet
 
     def _remove_watermark(self, image: Image.Image) -> Image.Image:
         """Remove NotebookLM watermark by masking bottom-right area."""
@@ -89,11 +351,23 @@ class SaaSConverter:
     def create_pptx(
         self, 
         images: List[Image.Image], 
-        output_path: Union[str, Path],
+        output_path: Union[str, Path, BinaryIO],
         generate_notes: bool = True,
-        context: Optional[str] = None
-    ) -> Path:
-        """Create PPTX from images and generate notes."""
+        context: Optional[str] = None,
+        checkpoint: Optional[JobCheckpoint] = None,
+        notes: Optional[List[Optional[str]]] = None,
+        page_texts: Optional[List[Tuple[str, bool]]] = None
+    ) -> Union[Path, BinaryIO]:
+        """
+        Create PPTX from images and generate notes.
+
+        ``output_path`` may be a writable binary stream, so the result can be
+        handed to a storage backend without touching the temp directory.
+        Notes already stored in ``checkpoint`` are reused instead of
+        calling the AI provider again. Passing ``notes`` (one entry per
+        image) skips generation entirely. ``page_texts`` (from
+        extract_page_texts) feeds the hybrid/text notes input modes.
+        """
         prs = Presentation()
         prs.slide_width = self.SLIDE_WIDTH
         prs.slide_height = self.SLIDE_HEIGHT
@@ -112,26 +386,139 @@ class SaaSConverter:
                     width=self.SLIDE_WIDTH, height=self.SLIDE_HEIGHT
                 )
             
-            # Generate notes
-            if generate_notes and self.ai_provider:
-                try:
-                    notes = self.ai_provider.analyze_slide(img, context)
-                    notes_slide = slide.notes_slide
-                    notes_frame = notes_slide.notes_text_frame
-                    notes_frame.text = notes
-                except Exception as e:
-                    print(f"Notes generation failed for slide {idx+1}: {e}")
+            # Generate notes (or use precomputed ones)
+            if notes is not None:
+                slide_notes = notes[idx]
+            elif generate_notes and self.ai_provider:
+                page_info = page_texts[idx] if page_texts else None
+                slide_notes = self.generate_slide_notes(img, idx, context, checkpoint, page_info)
+            else:
+                slide_notes = None
+
+            if slide_notes:
+                notes_slide = slide.notes_slide
+                notes_frame = notes_slide.notes_text_frame
+                notes_frame.text = slide_notes
         
-        prs.save(str(output_path))
-        return Path(output_path)
+        if isinstance(output_path, (str, Path)):
+            prs.save(str(output_path))
+            return Path(output_path)
+        prs.save(output_path)
+        return output_path
+
+    def generate_slide_notes(
+        self,
+        image: Image.Image,
+        idx: int,
+        context: Optional[str] = None,
+        checkpoint: Optional[JobCheckpoint] = None,
+        page_info: Optional[Tuple[str, bool]] = None,
+        on_progress: Optional[Callable[[str], None]] = None
+    ) -> Optional[str]:
+        """
+        Generate notes for one slide; returns None if generation fails.
+
+        Partial notes go to ``on_progress`` when given, otherwise to the
+        converter's ``progress_callback``.
+        """
+        cached = checkpoint.get_notes(idx) if checkpoint else None
+        if cached is not None:
+            return cached
+
+        try:
+            payload_image, page_text = self._notes_payload(image, page_info)
+            notes = self.ai_provider.generate_notes(
+                payload_image,
+                context,
+                on_progress=on_progress or self._progress_listener(idx),
+                stop=self.stop_condition,
+                page_text=page_text
+            )
+        except Exception as e:
+            print(f"Notes generation failed for slide {idx+1}: {e}")
+            return None
+
+        if checkpoint:
+            try:
+                checkpoint.save_notes(idx, notes)
+            except Exception as e:
+                # The notes are already paid for; only resumability is lost
+                print(f"Checkpoint write failed for slide {idx+1}: {e}")
+        return notes
+
+    def _progress_listener(self, idx: int) -> Optional[Callable[[str], None]]:
+        if not self.progress_callback:
+            return None
+        return lambda partial: self.progress_callback(idx, partial)
 
     def convert(
         self,
         pdf_path: Union[str, Path],
-        output_path: Union[str, Path],
+        output_path: Union[str, Path, BinaryIO],
         generate_notes: bool = True,
-        context: Optional[str] = None
-    ) -> Path:
-        """Full conversion pipeline."""
-        images = self.convert_pdf_to_images(pdf_path)
-        return self.create_pptx(images, output_path, generate_notes, context)
+        context: Optional[str] = None,
+        pages: Optional[str] = None,
+        job_id: Optional[str] = None
+    ) -> Union[Path, BinaryIO]:
+        """
+        Full conversion pipeline.
+
+        When ``checkpoint_dir`` is set, per-slide progress is checkpointed
+        under ``job_id`` (default: a hash of the input and settings), so a
+        retry of a failed job resumes from the last completed slide.
+        """
+        checkpoint = None
+        if self.checkpoint_dir:
+            checkpoint = self.open_checkpoint(pdf_path, pages, context, job_id)
+
+        try:
+            images = self.convert_pdf_to_images(pdf_path, pages=pages, checkpoint=checkpoint)
+            page_texts = None
+            if generate_notes and self.notes_input != "image":
+                page_texts = self.extract_page_texts(pdf_path, pages)
+            result = self.create_pptx(
+                images,
+                output_path,
+                generate_notes,
+                context,
+                checkpoint,
+                page_texts=page_texts
+            )
+            if checkpoint:
+                checkpoint.discard()
+            return result
+        finally:
+            if checkpoint:
+                checkpoint.close()
+
+    def open_checkpoint(
+        self,
+        pdf_path: Union[str, Path],
+        pages: Optional[str] = None,
+        context: Optional[str] = None,
+        job_id: Optional[str] = None
+    ) -> JobCheckpoint:
+        """Open (or resume) the checkpoint for a conversion job."""
+        render_key = fingerprint({
+            "input": hash_file(pdf_path),
+            "pages": pages,
+            "dpi": self.dpi,
+            "auto_dpi": self.auto_dpi,
+            "min_dpi": self.min_dpi,
+            "remove_watermark": self.remove_watermark,
+        })
+        notes_key = fingerprint({
+            "provider": self.provider_name,
+            "model": self.ai_provider.model if self.ai_provider else None,
+            "context": context,
+            "max_chars": self.stop_condition.max_chars if self.stop_condition else None,
+            "sections": self.stop_condition.sections if self.stop_condition else None,
+            "notes_input": self.notes_input,
+            "hybrid_image_max_side": self.hybrid_image_max_side,
+        })
+        return JobCheckpoint(
+            self.checkpoint_dir,
+            job_id or render_key[:32],
+            render_key,
+            notes_key
+        )
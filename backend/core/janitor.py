@@ -0,0 +1,175 @@
+"""
+Temp File Janitor
+Enforces age and total-size limits on working directories.
+
+On Cloud Run /tmp is RAM-backed, so stale uploads and outputs consume
+instance memory; this mirrors backend/lifecycle.json for local files.
+"""
+
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Set, Tuple
+
+
+class SweepRule:
+    """Limits for one directory managed by the janitor."""
+
+    def __init__(
+        self,
+        directory: Path,
+        max_age: float,
+        max_bytes: Optional[int] = None,
+        keep_younger_than: float = 0,
+        per_subdirectory: bool = False
+    ):
+        """
+        Args:
+            directory: Directory to sweep (recursively)
+            max_age: Maximum age in seconds
+            max_bytes: Maximum combined size of the directory (None for no limit)
+            keep_younger_than: Entries younger than this are never trimmed for size
+                (e.g. outputs whose download URL has not expired)
+            per_subdirectory: Treat each immediate subdirectory as one unit, aged by
+                its most recently modified file and removed as a whole
+        """
+        self.directory = Path(directory)
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.keep_younger_than = keep_younger_than
+        self.per_subdirectory = per_subdirectory
+
+
+class TempJanitor:
+    """Deletes expired entries and trims the oldest beyond each directory's budget."""
+
+    def __init__(self, rules: Optional[List[SweepRule]] = None):
+        self.rules: List[SweepRule] = list(rules or [])
+        self._held: Set[Path] = set()
+        self._held_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_directory(self, directory: Path, max_age: float, **kwargs) -> None:
+        """Register a directory; keyword arguments are passed to SweepRule."""
+        self.rules.append(SweepRule(directory, max_age, **kwargs))
+
+    def acquire(self, *paths: Path) -> None:
+        """Protect files or directories in use by a running job from sweeping."""
+        with self._held_lock:
+            self._held |= {Path(p).resolve() for p in paths}
+
+    def release(self, *paths: Path) -> None:
+        with self._held_lock:
+            self._held -= {Path(p).resolve() for p in paths}
+
+    @contextmanager
+    def hold(self, *paths: Path) -> Iterator[None]:
+        """Context manager form of acquire/release."""
+        self.acquire(*paths)
+        try:
+            yield
+        finally:
+            self.release(*paths)
+
+    def _is_held(self, path: Path) -> bool:
+        path = path.resolve()
+        with self._held_lock:
+            return any(path == held or held in path.parents for held in self._held)
+
+    @staticmethod
+    def _units(rule: SweepRule) -> List[Tuple[float, int, Path]]:
+        """Return (mtime, size, path) for each deletable unit under a rule."""
+        units = []
+        if rule.per_subdirectory:
+            candidates = [p for p in rule.directory.iterdir() if p.is_dir()]
+        else:
+            candidates = [p for p in rule.directory.rglob("*") if p.is_file()]
+
+        for path in candidates:
+            try:
+                if rule.per_subdirectory:
+                    stats = [f.stat() for f in path.rglob("*") if f.is_file()]
+                    mtime = max((s.st_mtime for s in stats), default=path.stat().st_mtime)
+                    size = sum(s.st_size for s in stats)
+                else:
+                    stat = path.stat()
+                    mtime, size = stat.st_mtime, stat.st_size
+            except FileNotFoundError:
+                continue
+            units.append((mtime, size, path))
+        return units
+
+    def sweep(self) -> int:
+        """
+        Run one cleanup pass.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        now = time.time()
+        for rule in self.rules:
+            if not rule.directory.exists():
+                continue
+
+            # Oldest first, so size trimming evicts the stalest entries
+            units = sorted(self._units(rule))
+            total = sum(size for _, size, _ in units)
+            for mtime, size, path in units:
+                age = now - mtime
+                expired = age > rule.max_age
+                over_budget = (
+                    rule.max_bytes is not None
+                    and total > rule.max_bytes
+                    and age >= rule.keep_younger_than
+                )
+                if not (expired or over_budget) or self._is_held(path):
+                    continue
+                try:
+                    if path.is_dir():
+                        shutil.rmtree(path)
+                    else:
+                        os.remove(path)
+                    removed += 1
+                    total -= size
+                except FileNotFoundError:
+                    total -= size
+                except Exception as e:
+                    print(f"Error cleaning up {path}: {e}")
+
+            self._remove_empty_dirs(rule.directory)
+        return removed
+
+    def _remove_empty_dirs(self, root: Path) -> None:
+        """Remove empty subdirectories left behind (deepest first), keeping root."""
+        for path in sorted((p for p in root.rglob("*") if p.is_dir()), key=lambda p: len(p.parts), reverse=True):
+            if self._is_held(path):
+                continue
+            try:
+                path.rmdir()
+            except OSError:
+                pass  # not empty, or already gone
+
+    def start(self, interval: float = 300) -> None:
+        """Sweep every ``interval`` seconds on a daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return
+
+        def _loop():
+            while not self._stop.is_set():
+                try:
+                    self.sweep()
+                except Exception as e:
+                    print(f"Janitor sweep failed: {e}")
+                self._stop.wait(interval)
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -0,0 +1,230 @@
+"""
+Output Storage Backends
+Pluggable destinations for finished PPTX files with short-lived download URLs
+"""
+
+import hashlib
+import hmac
+import os
+import secrets
+import shutil
+import time
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional
+from urllib.parse import urlencode
+
+
+class StorageBackend(ABC):
+    """Abstract base class for output storage."""
+
+    @abstractmethod
+    def upload(self, stream: BinaryIO, key: str, content_type: Optional[str] = None) -> str:
+        """
+        Store the contents of ``stream`` under ``key``.
+
+        Args:
+            stream: Readable binary stream positioned at the start of the data
+            key: Object key (relative path)
+            content_type: Optional MIME type
+
+        Returns:
+            The stored key
+        """
+        pass
+
+    @abstractmethod
+    def get_download_url(self, key: str, expires_in: int = 3600) -> str:
+        """
+        Get a short-lived download URL for ``key``.
+
+        Args:
+            key: Object key
+            expires_in: URL lifetime in seconds
+
+        Returns:
+            Download URL
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete ``key`` if it exists."""
+        pass
+
+
+class LocalStorage(StorageBackend):
+    """
+    Local directory storage with HMAC-signed download URLs.
+
+    URLs point at ``{base_url}/{key}?expires=...&sig=...`` and are checked
+    with ``verify``; the app serves them from ``path_for``.
+    """
+
+    def __init__(self, root: Path, base_url: str = "/download", secret: Optional[str] = None):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.base_url = base_url.rstrip("/")
+        if not secret:
+            # Per-process secret: URLs only verify on the instance that signed them
+            print("WARNING: DOWNLOAD_URL_SECRET not set; using a random per-process secret.")
+            secret = secrets.token_hex(32)
+        self._secret = secret.encode()
+
+    def path_for(self, key: str) -> Path:
+        """Resolve ``key`` inside the storage root, rejecting path traversal."""
+        path = (self.root / key).resolve()
+        if self.root.resolve() not in path.parents:
+            raise ValueError(f"Invalid storage key: {key}")
+        return path
+
+    def upload(self, stream: BinaryIO, key: str, content_type: Optional[str] = None) -> str:
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as out:
+            shutil.copyfileobj(stream, out)
+        return key
+
+    def _sign(self, key: str, expires: int) -> str:
+        message = f"{key}:{expires}".encode()
+        return hmac.new(self._secret, message, hashlib.sha256).hexdigest()
+
+    def get_download_url(self, key: str, expires_in: int = 3600) -> str:
+        expires = int(time.time()) + expires_in
+        query = urlencode({"expires": expires, "sig": self._sign(key, expires)})
+        return f"{self.base_url}/{key}?{query}"
+
+    def verify(self, key: str, expires: int, sig: str) -> bool:
+        """Check a signed URL's signature and expiry."""
+        if expires < time.time():
+            return False
+        return hmac.compare_digest(self._sign(key, expires), sig)
+
+    def delete(self, key: str) -> None:
+        path = self.path_for(key)
+        if path.exists():
+            os.remove(path)
+
+
+class GCSStorage(StorageBackend):
+    """
+    Google Cloud Storage / Firebase Storage backend.
+
+    Accepts any bucket object exposing the ``google.cloud.storage.Bucket``
+    blob API, so ``LocalBucket`` can stand in for it locally.
+    """
+
+    def __init__(self, bucket_name: Optional[str] = None, bucket=None):
+        if bucket is None:
+            # Imported lazily; firebase_admin must already be initialized
+            from firebase_admin import storage
+            bucket = storage.bucket(bucket_name)
+        self.bucket = bucket
+
+    def upload(self, stream: BinaryIO, key: str, content_type: Optional[str] = None) -> str:
+        blob = self.bucket.blob(key)
+        blob.upload_from_file(stream, content_type=content_type)
+        return key
+
+    def _signing_kwargs(self) -> Dict[str, str]:
+        """
+        Extra ``generate_signed_url`` arguments for credentials without a
+        private key (e.g. Cloud Run's default credentials).
+
+        Such credentials sign through the IAM signBlob API instead, which
+        requires the service account to hold the Service Account Token
+        Creator role on itself.
+        """
+        credentials = getattr(getattr(self.bucket, "client", None), "_credentials", None)
+        if credentials is None:
+            return {}
+        from google.auth.credentials import Signing
+        if isinstance(credentials, Signing):
+            return {}
+
+        if not credentials.valid:
+            from google.auth.transport.requests import Request
+            credentials.refresh(Request())
+        return {
+            "service_account_email": credentials.service_account_email,
+            "access_token": credentials.token,
+        }
+
+    def get_download_url(self, key: str, expires_in: int = 3600) -> str:
+        blob = self.bucket.blob(key)
+        return blob.generate_signed_url(
+            version="v4",
+            expiration=timedelta(seconds=expires_in),
+            method="GET",
+            **self._signing_kwargs()
+        )
+
+    def delete(self, key: str) -> None:
+        blob = self.bucket.blob(key)
+        if blob.exists():
+            blob.delete()
+
+
+class LocalBlob:
+    """Minimal stand-in for ``google.cloud.storage.Blob`` backed by a file."""
+
+    def __init__(self, bucket: "LocalBucket", name: str):
+        self.bucket = bucket
+        self.name = name
+        self.path = bucket.storage.path_for(name)
+
+    def upload_from_file(self, stream: BinaryIO, content_type: Optional[str] = None) -> None:
+        self.bucket.storage.upload(stream, self.name, content_type)
+
+    def generate_signed_url(self, version: str = "v4", expiration: timedelta = timedelta(hours=1), method: str = "GET") -> str:
+        return self.bucket.storage.get_download_url(self.name, int(expiration.total_seconds()))
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def delete(self) -> None:
+        self.bucket.storage.delete(self.name)
+
+
+class LocalBucket:
+    """Local fake of a GCS bucket for development and tests."""
+
+    def __init__(self, root: Path, base_url: str = "/download", secret: Optional[str] = None):
+        self.storage = LocalStorage(root, base_url=base_url, secret=secret)
+
+    def blob(self, name: str) -> LocalBlob:
+        return LocalBlob(self, name)
+
+
+def create_storage(
+    backend: Optional[str] = None,
+    root: Optional[Path] = None,
+    bucket_name: Optional[str] = None,
+    secret: Optional[str] = None,
+    base_url: str = "/download"
+) -> StorageBackend:
+    """
+    Build a storage backend from arguments or environment.
+
+    Environment:
+        STORAGE_BACKEND: 'local' (default), 'gcs', or 'gcs-fake'
+        STORAGE_DIR: Root directory for local storage
+        STORAGE_BUCKET: Bucket name for GCS
+        DOWNLOAD_URL_SECRET: HMAC secret for local signed URLs
+
+    ``base_url`` is the prefix of local download URLs; pass an absolute URL
+    when clients live on another origin.
+    """
+    backend = (backend or os.getenv("STORAGE_BACKEND", "local")).lower()
+    secret = secret or os.getenv("DOWNLOAD_URL_SECRET")
+    if root is None:
+        root = Path(os.getenv("STORAGE_DIR") or Path.cwd() / "outputs")
+
+    if backend == "local":
+        return LocalStorage(root, base_url=base_url, secret=secret)
+    if backend == "gcs":
+        return GCSStorage(bucket_name or os.getenv("STORAGE_BUCKET"))
+    if backend == "gcs-fake":
+        return GCSStorage(bucket=LocalBucket(root, base_url=base_url, secret=secret))
+    raise ValueError(f"Unsupported storage backend: {backend}")
@@ -0,0 +1,21 @@
+import sys
+from pathlib import Path
+
+import fitz  # PyMuPDF
+import pytest
+
+# Tests import the app the same way uvicorn does, from the backend directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    """A small text-only PDF with three pages."""
+    path = tmp_path / "sample.pdf"
+    doc = fitz.open()
+    for n in range(3):
+        page = doc.new_page(width=400, height=300)
+        page.insert_text((40, 60), f"Slide {n + 1}", fontsize=24)
+    doc.save(path)
+    doc.close()
+    return path
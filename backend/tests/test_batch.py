@@ -0,0 +1,156 @@
+import io
+import json
+import threading
+import zipfile
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+import app.main as main
+from core.ai_providers.fake import FakeProvider
+from core.batch import BatchConverter, write_batch_zip
+from core.converter import SaaSConverter
+
+
+class TrackingConverter(SaaSConverter):
+    """Records how many documents hold rendered pages at the same time."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def convert_pdf_to_images(self, *args, **kwargs):
+        images = super().convert_pdf_to_images(*args, **kwargs)
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        return images
+
+    def create_pptx(self, *args, **kwargs):
+        try:
+            return super().create_pptx(*args, **kwargs)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def make_converter(provider=None, cls=SaaSConverter):
+    converter = cls(dpi=36)
+    converter.ai_provider = provider
+    return converter
+
+
+def test_mixed_ok_and_error_documents(tmp_path, sample_pdf):
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+    provider = FakeProvider(latency=0)
+    batch = BatchConverter(make_converter(provider))
+
+    results = batch.convert_many(
+        [("a.pptx", sample_pdf), ("b.pptx", broken), ("c.pptx", sample_pdf)],
+        sources=["a.pdf", "upload.zip/b.pdf", "c.pdf"]
+    )
+
+    assert [r.status for r in results] == ["ok", "error", "ok"]
+    assert [r.slides for r in results] == [3, 0, 3]
+    assert provider.calls == 6
+    assert results[1].source == "upload.zip/b.pdf"
+    # Clients get a fixed message, never the server-side temp path
+    assert str(tmp_path) not in results[1].error
+
+    buffer = io.BytesIO()
+    write_batch_zip(results, buffer)
+    with zipfile.ZipFile(buffer) as archive:
+        assert sorted(archive.namelist()) == ["a.pptx", "c.pptx", "status.json"]
+        status = json.loads(archive.read("status.json"))
+    assert [f["status"] for f in status["files"]] == ["ok", "error", "ok"]
+
+
+def test_unexpected_failure_does_not_hang(sample_pdf):
+    class FailingConverter(SaaSConverter):
+        def create_pptx(self, images, *args, **kwargs):
+            if len(images) == 1:
+                raise RuntimeError("boom")
+            return super().create_pptx(images, *args, **kwargs)
+
+    batch = BatchConverter(make_converter(FakeProvider(latency=0), FailingConverter), max_documents_in_flight=1)
+    documents = [("a.pptx", sample_pdf), ("b.pptx", sample_pdf)]
+
+    assert [r.status for r in batch.convert_many(documents)] == ["ok", "ok"]
+    results = batch.convert_many(documents, pages="1")
+    assert [(r.status, r.error) for r in results] == [("error", "Conversion failed.")] * 2
+
+
+def test_one_document_in_flight(sample_pdf):
+    converter = make_converter(FakeProvider(latency=0.01), TrackingConverter)
+    batch = BatchConverter(converter, render_workers=4, max_documents_in_flight=1)
+
+    results = batch.convert_many([(f"{n}.pptx", sample_pdf) for n in range(4)])
+
+    assert all(r.status == "ok" for r in results)
+    assert converter.peak == 1
+
+
+def test_documents_in_flight_bound(sample_pdf):
+    converter = make_converter(FakeProvider(latency=0.05), TrackingConverter)
+    batch = BatchConverter(converter, render_workers=4, max_documents_in_flight=2)
+
+    batch.convert_many([(f"{n}.pptx", sample_pdf) for n in range(6)])
+
+    assert converter.peak == 2
+
+
+def test_batch_without_notes(sample_pdf):
+    provider = FakeProvider(latency=0)
+    batch = BatchConverter(make_converter(provider))
+
+    results = batch.convert_many([("a.pptx", sample_pdf)], generate_notes=False)
+    assert results[0].status == "ok" and results[0].slides == 3
+    assert provider.calls == 0
+
+    # Without a provider notes are skipped even when requested
+    results = BatchConverter(make_converter(None)).convert_many([("a.pptx", sample_pdf)])
+    assert results[0].status == "ok" and results[0].slides == 3
+
+
+def test_batch_url_download_is_served_as_zip(sample_pdf, tmp_path, monkeypatch):
+    def offline_converter(**kwargs):
+        kwargs["api_key"] = None
+        converter = SaaSConverter(**kwargs)
+        converter.ai_provider = FakeProvider(latency=0)
+        return converter
+
+    monkeypatch.setattr(main, "storage", main.LocalStorage(tmp_path, secret="test"))
+    with mock.patch.object(main, "SaaSConverter", offline_converter):
+        client = TestClient(main.app)
+        with open(sample_pdf, "rb") as f:
+            response = client.post(
+                "/convert-batch",
+                files=[("files", ("deck.pdf", f, "application/pdf"))],
+                data={"api_key": "test-key", "delivery": "url"}
+            )
+    assert response.status_code == 200
+    assert response.json()["files"][0]["status"] == "ok"
+
+    download = client.get(response.json()["download_url"])
+    assert download.status_code == 200
+    assert download.headers["content-type"] == main.ZIP_MEDIA_TYPE
+    assert zipfile.ZipFile(io.BytesIO(download.content)).namelist() == ["deck.pptx", "status.json"]
+
+
+def test_progress_is_reported_per_document(sample_pdf):
+    events = []
+    lock = threading.Lock()
+
+    def on_progress(name, idx, partial):
+        with lock:
+            events.append((name, idx))
+
+    batch = BatchConverter(make_converter(FakeProvider(latency=0)), progress_callback=on_progress)
+    batch.convert_many([("a.pptx", sample_pdf), ("b.pptx", sample_pdf)], pages="1-2")
+
+    assert {(name, idx) for name, idx in events} == {
+        ("a.pptx", 0), ("a.pptx", 1), ("b.pptx", 0), ("b.pptx", 1)
+    }
@@ -0,0 +1,165 @@
+import json
+import threading
+
+import pytest
+from PIL import Image
+
+from core.ai_providers.fake import FakeProvider
+from core.checkpoint import JobBusyError, JobCheckpoint, scoped_job_id
+from core.converter import SaaSConverter
+
+
+class Crash(BaseException):
+    """Stands in for the process dying; not caught by the per-slide error handling."""
+
+
+class CrashingProvider(FakeProvider):
+    """FakeProvider that dies after ``crash_after`` notes requests."""
+
+    def __init__(self, crash_after: int):
+        super().__init__(latency=0)
+        self.crash_after = crash_after
+
+    def analyze_slide(self, image, context=None, page_text=None):
+        if self.calls >= self.crash_after:
+            raise Crash()
+        return super().analyze_slide(image, context, page_text)
+
+
+def make_converter(checkpoint_dir, provider, **kwargs):
+    converter = SaaSConverter(checkpoint_dir=checkpoint_dir, **kwargs)
+    converter.ai_provider = provider
+    return converter
+
+
+def test_resume_after_crash(tmp_path, sample_pdf):
+    root = tmp_path / "checkpoints"
+
+    crashing = CrashingProvider(crash_after=2)
+    with pytest.raises(Crash):
+        make_converter(root, crashing).convert(sample_pdf, tmp_path / "out.pptx", job_id="job-1")
+
+    job_dir = root / "job-1"
+    manifest = json.loads((job_dir / JobCheckpoint.MANIFEST).read_text(encoding="utf-8"))
+    assert sorted(manifest["notes"]) == ["0", "1"]
+    assert len(list(job_dir.glob("slide_*.png"))) == 3
+
+    # The retry only asks for the slide that had no notes yet
+    retry = FakeProvider(latency=0)
+    make_converter(root, retry).convert(sample_pdf, tmp_path / "out.pptx", job_id="job-1")
+    assert retry.calls == 1
+    assert (tmp_path / "out.pptx").exists()
+    # Finished jobs remove their checkpoint
+    assert not (root / "job-1").exists()
+
+
+def test_render_key_change_resets_checkpoint(tmp_path):
+    checkpoint = JobCheckpoint(tmp_path, "job", render_key="r1", notes_key="n1")
+    checkpoint.save_image(0, Image.new("RGB", (8, 8)))
+    checkpoint.save_notes(0, "notes")
+
+    checkpoint.close()
+    checkpoint = JobCheckpoint(tmp_path, "job", render_key="r2", notes_key="n1")
+    assert checkpoint.load_image(0) is None
+    assert checkpoint.get_notes(0) is None
+
+
+def test_notes_key_change_keeps_images(tmp_path):
+    checkpoint = JobCheckpoint(tmp_path, "job", render_key="r1", notes_key="n1")
+    checkpoint.save_image(0, Image.new("RGB", (8, 8)))
+    checkpoint.save_notes(0, "notes")
+
+    checkpoint.close()
+    checkpoint = JobCheckpoint(tmp_path, "job", render_key="r1", notes_key="n2")
+    assert checkpoint.load_image(0) is not None
+    assert checkpoint.get_notes(0) is None
+
+
+def test_matching_keys_resume(tmp_path):
+    checkpoint = JobCheckpoint(tmp_path, "job", render_key="r1", notes_key="n1")
+    checkpoint.save_notes(1, "notes")
+    checkpoint.close()
+
+    assert JobCheckpoint(tmp_path, "job", render_key="r1", notes_key="n1").get_notes(1) == "notes"
+
+
+def test_changed_context_invalidates_notes_only(tmp_path, sample_pdf):
+    converter = make_converter(tmp_path, FakeProvider(latency=0))
+    first = converter.open_checkpoint(sample_pdf, context="A", job_id="job")
+    first.save_image(0, Image.new("RGB", (8, 8)))
+    first.save_notes(0, "notes")
+    first.close()
+
+    second = converter.open_checkpoint(sample_pdf, context="B", job_id="job")
+    assert second.load_image(0) is not None
+    assert second.get_notes(0) is None
+
+
+@pytest.mark.parametrize("job_id", ["", "../escape", "a/b", "x" * 129, "space id"])
+def test_invalid_job_id(tmp_path, job_id):
+    with pytest.raises(ValueError):
+        JobCheckpoint(tmp_path, job_id, render_key="r", notes_key="n")
+
+
+def test_running_job_is_locked(tmp_path):
+    first = JobCheckpoint(tmp_path, "job", render_key="r1", notes_key="n1")
+    first.save_notes(0, "notes")
+
+    # A second job, even with a different input, must not reset the running one
+    with pytest.raises(JobBusyError):
+        JobCheckpoint(tmp_path, "job", render_key="r2", notes_key="n1")
+    assert first.get_notes(0) == "notes"
+
+    first.close()
+    assert JobCheckpoint(tmp_path, "job", render_key="r1", notes_key="n1").get_notes(0) == "notes"
+
+
+def test_discard_releases_lock(tmp_path):
+    first = JobCheckpoint(tmp_path, "job", render_key="r1", notes_key="n1")
+    first.discard()
+    assert not (tmp_path / "job").exists()
+
+    second = JobCheckpoint(tmp_path, "job", render_key="r1", notes_key="n1")
+    assert (tmp_path / "job" / JobCheckpoint.LOCK).exists()
+    second.close()
+
+
+def test_concurrent_conversions_of_same_pdf(tmp_path, sample_pdf):
+    outcomes = []
+
+    def run(n):
+        converter = make_converter(tmp_path / "checkpoints", FakeProvider(latency=0.2))
+        try:
+            converter.convert(sample_pdf, tmp_path / f"out{n}.pptx")
+            outcomes.append("ok")
+        except JobBusyError:
+            outcomes.append("busy")
+
+    threads = [threading.Thread(target=run, args=(n,)) for n in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(outcomes) == ["busy", "ok"]
+
+
+def test_scoped_job_id():
+    assert scoped_job_id("job", "alice") == scoped_job_id("job", "alice")
+    assert scoped_job_id("job", "alice") != scoped_job_id("job", "bob")
+    assert scoped_job_id("job", None) != scoped_job_id("job", "alice")
+    with pytest.raises(ValueError):
+        scoped_job_id("../job", "alice")
+
+
+def test_failed_checkpoint_write_keeps_notes(tmp_path):
+    class BrokenCheckpoint(JobCheckpoint):
+        def save_notes(self, idx, notes):
+            raise OSError("No space left on device")
+
+    checkpoint = BrokenCheckpoint(tmp_path, "job", render_key="r", notes_key="n")
+    try:
+        converter = make_converter(tmp_path, FakeProvider(latency=0))
+        notes = converter.generate_slide_notes(Image.new("RGB", (8, 8)), 0, checkpoint=checkpoint)
+    finally:
+        checkpoint.close()
+    assert notes and "발표 팁" in notes
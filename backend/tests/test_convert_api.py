@@ -0,0 +1,91 @@
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from core.checkpoint import JobCheckpoint, scoped_job_id
+from core.ai_providers.fake import FakeProvider
+from core.converter import SaaSConverter
+
+
+def offline_converter(**kwargs):
+    """Build the converter /convert asks for, with FakeProvider in place of the real SDK."""
+    kwargs["api_key"] = None
+    converter = SaaSConverter(**kwargs)
+    converter.ai_provider = FakeProvider(latency=0)
+    return converter
+
+
+@pytest.fixture
+def client():
+    with mock.patch.object(main, "SaaSConverter", offline_converter):
+        yield TestClient(main.app)
+
+
+def post_convert(client, pdf_path, headers=None, **form):
+    data = {"api_key": "test-key", **form}
+    with open(pdf_path, "rb") as f:
+        return client.post(
+            "/convert",
+            files={"pdf_file": ("sample.pdf", f, "application/pdf")},
+            data=data,
+            headers=headers
+        )
+
+
+def test_convert_returns_pptx(client, sample_pdf):
+    response = post_convert(client, sample_pdf, pages="1-2")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == main.PPTX_MEDIA_TYPE
+
+
+@pytest.mark.parametrize("pages", ["0", "2-9", "abc", ","])
+def test_convert_rejects_bad_page_range(client, sample_pdf, pages):
+    response = post_convert(client, sample_pdf, pages=pages)
+    assert response.status_code == 400
+    assert "페이지" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("job_id", ["../etc", "a b", "x" * 129])
+def test_convert_rejects_bad_job_id(client, sample_pdf, job_id):
+    response = post_convert(client, sample_pdf, job_id=job_id)
+    assert response.status_code == 400
+    assert "Invalid job id" in response.json()["detail"]
+
+
+def test_convert_refuses_running_job(client, sample_pdf, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "JOB_CHECKPOINT_DIR", tmp_path)
+    running = JobCheckpoint(tmp_path, scoped_job_id("deck-1", "alice"), render_key="r", notes_key="n")
+    try:
+        response = post_convert(client, sample_pdf, job_id="deck-1", headers={"uid": "alice"})
+        assert response.status_code == 409
+        # The same id from another user is a different job
+        response = post_convert(client, sample_pdf, job_id="deck-1", headers={"uid": "bob"})
+        assert response.status_code == 200
+    finally:
+        running.close()
+
+
+def test_convert_rejects_bad_notes_input(client, sample_pdf):
+    response = post_convert(client, sample_pdf, notes_input="audio")
+    assert response.status_code == 400
+    assert "audio" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("form", [
+    {"dpi": "0"},
+    {"auto_dpi": "true", "min_dpi": "0"},
+    {"auto_dpi": "true", "min_dpi": "300"},
+])
+def test_convert_rejects_bad_dpi(client, sample_pdf, form):
+    response = post_convert(client, sample_pdf, **form)
+    assert response.status_code == 400
+    assert "dpi" in response.json()["detail"]
+
+
+@pytest.mark.parametrize("max_chars", ["0", "-5"])
+def test_convert_rejects_bad_notes_max_chars(client, sample_pdf, max_chars):
+    response = post_convert(client, sample_pdf, notes_max_chars=max_chars)
+    assert response.status_code == 400
+    assert "notes_max_chars" in response.json()["detail"]
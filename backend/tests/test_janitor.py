@@ -0,0 +1,88 @@
+import os
+import time
+
+from core.janitor import TempJanitor
+
+
+def make_file(path, size=10, age=0):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_expired_files_are_deleted(tmp_path):
+    old = make_file(tmp_path / "old.pdf", age=120)
+    new = make_file(tmp_path / "new.pdf", age=10)
+    janitor = TempJanitor()
+    janitor.add_directory(tmp_path, max_age=60)
+
+    assert janitor.sweep() == 1
+    assert not old.exists()
+    assert new.exists()
+
+
+def test_held_files_are_kept(tmp_path):
+    held = make_file(tmp_path / "job" / "upload.pdf", age=120)
+    janitor = TempJanitor()
+    janitor.add_directory(tmp_path, max_age=60, max_bytes=0)
+
+    with janitor.hold(held.parent):
+        assert janitor.sweep() == 0
+        assert held.exists()
+
+    assert janitor.sweep() == 1
+    assert not held.exists()
+    # The emptied directory is removed too, but never the root
+    assert not held.parent.exists()
+    assert tmp_path.exists()
+
+
+def test_size_trim_evicts_oldest_first(tmp_path):
+    oldest = make_file(tmp_path / "a.pptx", size=100, age=30)
+    middle = make_file(tmp_path / "b.pptx", size=100, age=20)
+    newest = make_file(tmp_path / "c.pptx", size=100, age=10)
+    janitor = TempJanitor()
+    janitor.add_directory(tmp_path, max_age=3600, max_bytes=150)
+
+    assert janitor.sweep() == 2
+    assert not oldest.exists() and not middle.exists()
+    assert newest.exists()
+
+
+def test_size_trim_respects_keep_younger_than(tmp_path):
+    expired_link = make_file(tmp_path / "a.pptx", size=100, age=120)
+    live_link = make_file(tmp_path / "b.pptx", size=100, age=30)
+    janitor = TempJanitor()
+    janitor.add_directory(tmp_path, max_age=3600, max_bytes=50, keep_younger_than=60)
+
+    # Over budget either way, but b.pptx's download URL is still valid
+    assert janitor.sweep() == 1
+    assert not expired_link.exists()
+    assert live_link.exists()
+
+
+def test_budgets_are_per_directory(tmp_path):
+    work = make_file(tmp_path / "work" / "big.pdf", size=1000, age=10)
+    output = make_file(tmp_path / "outputs" / "small.pptx", size=10, age=10)
+    janitor = TempJanitor()
+    janitor.add_directory(tmp_path / "work", max_age=3600, max_bytes=2000)
+    janitor.add_directory(tmp_path / "outputs", max_age=3600, max_bytes=100)
+
+    assert janitor.sweep() == 0
+    assert work.exists() and output.exists()
+
+
+def test_per_subdirectory_ages_by_newest_file(tmp_path):
+    stale = tmp_path / "stale"
+    make_file(stale / "slide_0000.png", age=120)
+    active = tmp_path / "active"
+    make_file(active / "slide_0000.png", age=120)
+    make_file(active / "slide_0001.png", age=5)
+    janitor = TempJanitor()
+    janitor.add_directory(tmp_path, max_age=60, per_subdirectory=True)
+
+    assert janitor.sweep() == 1
+    assert not stale.exists()
+    assert (active / "slide_0000.png").exists()
@@ -0,0 +1,49 @@
+import fitz  # PyMuPDF
+import pytest
+from PIL import Image
+
+from core.converter import SaaSConverter
+
+BODY = "Quarterly revenue grew in every region. " * 8
+
+
+def make_page(text=BODY, bars=0, image=False):
+    doc = fitz.open()
+    page = doc.new_page(width=720, height=405)
+    page.insert_textbox(fitz.Rect(40, 40, 680, 200), text, fontsize=14)
+    for n in range(bars):
+        page.draw_rect(fitz.Rect(60 + n * 20, 300 - n * 3, 75 + n * 20, 380), color=(0, 0, 1), fill=(0, 0, 1))
+    if image:
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 64, 64), False)
+        pix.set_rect(pix.irect, (200, 50, 50))
+        page.insert_image(fitz.Rect(360, 200, 700, 400), pixmap=pix)
+    return doc, page
+
+
+@pytest.mark.parametrize("kwargs, dominant", [
+    ({}, True),
+    ({"bars": 3}, True),
+    ({"bars": 25}, False),
+    ({"image": True}, False),
+    ({"text": "Title only"}, False),
+])
+def test_text_dominant(kwargs, dominant):
+    doc, page = make_page(**kwargs)
+    text, text_dominant = SaaSConverter().extract_page_text(page)
+    doc.close()
+    assert text
+    assert text_dominant is dominant
+
+
+def test_text_mode_sends_chart_pages_with_image():
+    converter = SaaSConverter(notes_input="text", hybrid_image_max_side=64)
+    doc, page = make_page(bars=25)
+    page_info = converter.extract_page_text(page)
+    doc.close()
+
+    image, text = converter._notes_payload(Image.new("RGB", (640, 360)), page_info)
+    assert text == page_info[0]
+    assert image is not None and max(image.size) == 64
+
+    image, _ = converter._notes_payload(Image.new("RGB", (640, 360)), (BODY, True))
+    assert image is None
@@ -0,0 +1,44 @@
+import pytest
+
+from core.converter import SaaSConverter
+
+parse = SaaSConverter.parse_page_range
+
+
+@pytest.mark.parametrize("spec", [None, "", "   "])
+def test_empty_spec_selects_all_pages(spec):
+    assert parse(spec, 4) == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("spec, expected", [
+    ("1", [0]),
+    ("2-3", [1, 2]),
+    ("1-3,5", [0, 1, 2, 4]),
+    ("3-", [2, 3, 4]),
+    ("-2", [0, 1]),
+    ("-", [0, 1, 2, 3, 4]),
+    (" 2 , 4 ", [1, 3]),
+    ("1,,3,", [0, 2]),
+    ("5,1-2", [4, 0, 1]),
+    ("1-3,2-4,1", [0, 1, 2, 3]),
+])
+def test_valid_specs(spec, expected):
+    assert parse(spec, 5) == expected
+
+
+@pytest.mark.parametrize("spec", ["0", "6", "4-6", "3-1", "1--3", "0-2"])
+def test_out_of_range_specs(spec):
+    with pytest.raises(ValueError, match="문서 범위"):
+        parse(spec, 5)
+
+
+@pytest.mark.parametrize("spec", ["a", "1-b", "1.5", "1-2-3"])
+def test_malformed_specs(spec):
+    with pytest.raises(ValueError, match="잘못된 페이지 범위"):
+        parse(spec, 5)
+
+
+@pytest.mark.parametrize("spec", [",", " , ,"])
+def test_spec_selecting_nothing(spec):
+    with pytest.raises(ValueError, match="선택된 페이지가 없습니다"):
+        parse(spec, 5)
@@ -0,0 +1,45 @@
+import io
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+
+import app.main as main
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+def post_preview(client, pdf_path, **form):
+    with open(pdf_path, "rb") as f:
+        return client.post("/preview", files={"pdf_file": ("sample.pdf", f, "application/pdf")}, data=form)
+
+
+def test_contact_sheet(client, sample_pdf):
+    response = post_preview(client, sample_pdf, dpi=18, columns=3)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    # 400x300pt pages at 18 DPI are 100x75px, tiled 3 across with 8px padding
+    assert Image.open(io.BytesIO(response.content)).size == (3 * 100 + 4 * 8, 75 + 2 * 8)
+
+
+def test_thumbnails(client, sample_pdf):
+    response = post_preview(client, sample_pdf, mode="thumbnails", pages="2-3")
+    assert response.status_code == 200
+    assert response.json()["pages"] == 2
+
+
+@pytest.mark.parametrize("form", [
+    {"dpi": 0},
+    {"dpi": 17},
+    {"dpi": 97},
+    {"dpi": 600},
+    {"columns": 0},
+    {"columns": 13},
+    {"mode": "video"},
+    {"pages": "9"},
+])
+def test_invalid_preview_requests(client, sample_pdf, form):
+    assert post_preview(client, sample_pdf, **form).status_code == 400
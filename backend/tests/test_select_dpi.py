@@ -0,0 +1,80 @@
+import fitz  # PyMuPDF
+import pytest
+
+from core.converter import SaaSConverter
+
+
+@pytest.fixture
+def converter():
+    return SaaSConverter(dpi=144, auto_dpi=True, min_dpi=72)
+
+
+@pytest.fixture
+def page():
+    doc = fitz.open()
+    yield doc.new_page(width=720, height=405)
+    doc.close()
+
+
+def add_image(page, rect, width_px):
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, width_px, width_px), False)
+    pix.set_rect(pix.irect, (90, 140, 200))
+    page.insert_image(rect, pixmap=pix)
+
+
+def test_blank_page_uses_min_dpi(converter, page):
+    assert converter.select_dpi(page) == 72
+
+
+@pytest.mark.parametrize("fontsize, expected", [
+    (28, 72),    # large titles are legible at the floor
+    (14, 108),   # 20px glyphs need ~103 DPI, snapped up to a 36 DPI step
+    (8, 144),    # small print needs more than the base DPI; capped
+])
+def test_text_page(converter, page, fontsize, expected):
+    page.insert_text((40, 200), "Body text on the slide", fontsize=fontsize)
+    assert converter.select_dpi(page) == expected
+
+
+def test_marginal_page_number_is_ignored(converter, page):
+    page.insert_text((40, 200), "Body text on the slide", fontsize=28)
+    page.insert_text((680, 400), "12", fontsize=8)
+    assert converter.select_dpi(page) == 72
+
+
+def test_low_resolution_photo_page(converter, page):
+    # 64px across 288pt is 16 DPI native; nothing needs more than the floor
+    add_image(page, fitz.Rect(36, 36, 324, 324), 64)
+    assert converter.select_dpi(page) == 72
+
+
+def test_photo_keeps_native_resolution(converter, page):
+    # 200px across 144pt is 100 DPI native
+    add_image(page, fitz.Rect(36, 36, 180, 180), 200)
+    assert converter.select_dpi(page) == 108
+
+
+def test_vector_pages(converter, page):
+    page.draw_rect(fitz.Rect(40, 40, 200, 200), color=(0, 0, 0))
+    assert converter.select_dpi(page) == 108  # 0.75 x base DPI
+
+    for n in range(converter.VECTOR_HEAVY_PATHS + 1):
+        page.draw_line((40, 220 + n), (680, 220 + n), color=(0, 0, 0))
+    assert converter.select_dpi(page) == 144
+
+
+def test_never_above_base_dpi(page):
+    converter = SaaSConverter(dpi=96, auto_dpi=True, min_dpi=72)
+    page.insert_text((40, 200), "Fine print", fontsize=6)
+    add_image(page, fitz.Rect(36, 36, 108, 108), 600)
+    assert converter.select_dpi(page) == 96
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"dpi": 0},
+    {"auto_dpi": True, "min_dpi": 0},
+    {"auto_dpi": True, "min_dpi": 200, "dpi": 144},
+])
+def test_invalid_dpi_settings(kwargs):
+    with pytest.raises(ValueError):
+        SaaSConverter(**kwargs)
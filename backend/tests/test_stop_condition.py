@@ -0,0 +1,61 @@
+import pytest
+
+from core.ai_providers import NOTE_SECTIONS, StopCondition
+from core.ai_providers.fake import FakeProvider
+
+NOTES = "".join(f"**{section}**: 내용\n- **강조** 포인트\n\n" for section in NOTE_SECTIONS)
+
+
+def test_no_limits_never_stops():
+    assert not StopCondition().is_met(NOTES * 3)
+
+
+def test_max_chars():
+    stop = StopCondition(max_chars=10)
+    assert not stop.is_met("x" * 9)
+    assert stop.is_met("x" * 10)
+    assert stop.truncate("x" * 25) == "x" * 10
+
+
+def test_sections_wait_for_every_heading():
+    stop = StopCondition(sections=NOTE_SECTIONS)
+    partial = NOTES.split("**발표 팁**")[0]
+    assert not stop.is_met(partial + "**추가**: 내용\n")
+
+
+def test_last_section_is_not_cut_short():
+    stop = StopCondition(sections=NOTE_SECTIONS)
+    # Paragraph breaks and bullets inside the last section keep it going
+    assert not stop.is_met(NOTES)
+    assert not stop.is_met(NOTES + "- 천천히 말하기\n\n- 청중과 눈 맞추기\n\n")
+    assert stop.truncate(NOTES) == NOTES
+
+
+def test_stops_at_block_after_last_section():
+    stop = StopCondition(sections=NOTE_SECTIONS)
+    for marker in ["**추가 참고**: 내용", "## 마무리", "6. **요약**", "---"]:
+        text = NOTES + marker + "\n그 밖의 내용"
+        assert stop.is_met(text), marker
+        assert stop.truncate(text) == NOTES.rstrip()
+
+
+def test_heading_on_last_section_line_does_not_stop():
+    stop = StopCondition(sections=NOTE_SECTIONS)
+    partial = NOTES.split("**발표 팁**")[0] + "**발표 팁**: 강조"
+    assert not stop.is_met(partial)
+
+
+def test_generate_notes_cancels_stream():
+    class ChattyProvider(FakeProvider):
+        def _chunks(self, image, context):
+            return super()._chunks(image, context) + ["**추가**: 잡담\n\n", "더 많은 잡담\n\n"]
+
+    provider = ChattyProvider(latency=0)
+    notes = provider.generate_notes(None, stop=StopCondition(sections=NOTE_SECTIONS))
+    assert notes == "".join(FakeProvider._chunks(provider, None, None)).rstrip()
+
+
+def test_max_chars_must_be_positive():
+    for max_chars in (0, -5):
+        with pytest.raises(ValueError):
+            StopCondition(max_chars=max_chars)
@@ -0,0 +1,113 @@
+import io
+import time
+from datetime import timedelta
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from core.storage import GCSStorage, LocalStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalStorage(tmp_path, base_url="/download", secret="test-secret")
+
+
+def signed_params(url):
+    query = parse_qs(urlsplit(url).query)
+    return int(query["expires"][0]), query["sig"][0]
+
+
+def test_signed_url_roundtrip(storage):
+    storage.upload(io.BytesIO(b"data"), "job.pptx")
+    expires, sig = signed_params(storage.get_download_url("job.pptx", 60))
+    assert storage.verify("job.pptx", expires, sig)
+
+
+def test_tampered_or_expired_signature(storage):
+    expires, sig = signed_params(storage.get_download_url("job.pptx", 60))
+    assert not storage.verify("other.pptx", expires, sig)
+    assert not storage.verify("job.pptx", expires + 1, sig)
+    assert not storage.verify("job.pptx", expires, "0" * len(sig))
+
+    past = int(time.time()) - 1
+    assert not storage.verify("job.pptx", past, storage._sign("job.pptx", past))
+
+
+@pytest.mark.parametrize("key", ["../escape.pptx", "a/../../escape.pptx", "/etc/passwd"])
+def test_path_traversal_rejected(storage, key):
+    with pytest.raises(ValueError):
+        storage.path_for(key)
+    with pytest.raises(ValueError):
+        storage.upload(io.BytesIO(b"data"), key)
+
+
+@pytest.fixture
+def client(storage, monkeypatch):
+    monkeypatch.setattr(main, "storage", storage)
+    return TestClient(main.app)
+
+
+def test_download_endpoint(client, storage):
+    storage.upload(io.BytesIO(b"data"), "job.pptx")
+    url = storage.get_download_url("job.pptx", 60)
+    expires, sig = signed_params(url)
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.content == b"data"
+
+    tampered = client.get("/download/job.pptx", params={"expires": expires, "sig": "0" * len(sig)})
+    assert tampered.status_code == 403
+
+    past = int(time.time()) - 1
+    expired = client.get("/download/job.pptx", params={"expires": past, "sig": storage._sign("job.pptx", past)})
+    assert expired.status_code == 403
+
+
+class FakeCredentials:
+    """Token-only credentials, like Cloud Run's metadata server credentials."""
+
+    service_account_email = "runner@example.iam.gserviceaccount.com"
+
+    def __init__(self):
+        self.valid = False
+        self.token = None
+
+    def refresh(self, request):
+        self.valid = True
+        self.token = "access-token"
+
+
+class FakeBlob:
+    def __init__(self):
+        self.signed_with = None
+
+    def generate_signed_url(self, **kwargs):
+        self.signed_with = kwargs
+        return "https://storage.example/signed"
+
+
+class FakeBucket:
+    def __init__(self, credentials):
+        self.client = type("Client", (), {"_credentials": credentials})()
+        self.last_blob = FakeBlob()
+
+    def blob(self, name):
+        return self.last_blob
+
+
+def test_gcs_signs_through_iam_without_private_key(monkeypatch):
+    monkeypatch.setattr("google.auth.transport.requests.Request", lambda: None)
+    bucket = FakeBucket(FakeCredentials())
+
+    assert GCSStorage(bucket=bucket).get_download_url("job.pptx", 60) == "https://storage.example/signed"
+    assert bucket.last_blob.signed_with == {
+        "version": "v4",
+        "expiration": timedelta(seconds=60),
+        "method": "GET",
+        "service_account_email": FakeCredentials.service_account_email,
+        "access_token": "access-token",
+    }